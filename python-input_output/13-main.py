@@ -0,0 +1,5 @@
+#!/usr/bin/python3
+read_file_stream = __import__('13-read_file_stream').read_file_stream
+
+read_file_stream("my_file_0.txt")
+read_file_stream("my_file_0.txt", chunk_size=7)
@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+"""
+Module that streams a text file to stdout in fixed-size chunks.
+"""
+
+import codecs
+import sys
+
+
+def read_file_stream(filename="", chunk_size=65536):
+    """
+    Reads a UTF-8 text file and prints its content to stdout.
+
+    Unlike read_file, the file is never held in memory as a whole: it
+    is read once, in chunks of chunk_size bytes, so peak memory does not
+    depend on the size of the file. Each chunk goes through an
+    incremental UTF-8 decoder, so a multi-byte character split across
+    two chunks is still decoded correctly. When stdout is UTF-8 and has
+    a binary buffer, the checked bytes are written to it as they are,
+    skipping the re-encoding of the text.
+
+    Invalid UTF-8 raises UnicodeDecodeError once the text before the
+    chunk holding it has been printed, whatever stdout is.
+
+    Args:
+        filename (str): Path of the file to print
+        chunk_size (int): Number of bytes read per chunk
+    """
+    out = None
+    if (getattr(sys.stdout, "encoding", None) or "").lower() in ("utf-8",
+                                                                 "utf8"):
+        out = getattr(sys.stdout, "buffer", None)
+    with open(filename, "rb") as f:
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        if out is not None:
+            sys.stdout.flush()
+        pending = b""  # start of a character cut by the previous chunk
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            text = decoder.decode(chunk)
+            if out is None:
+                print(text, end="")
+                continue
+            # Write exactly the bytes decoded so far, so both paths
+            # stop at the same character on invalid input
+            data = pending + chunk
+            pending = decoder.getstate()[0]
+            out.write(data[:len(data) - len(pending)])
+        text = decoder.decode(b"", final=True)
+        if out is None:
+            print(text, end="")
+        else:
+            out.write(pending)
+            out.flush()
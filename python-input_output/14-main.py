@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+"""
+Compares the buffered and memory-mapped read paths on cold and warm
+page cache.
+
+Usage: ./14-main.py [number_of_records]
+"""
+import os
+import sys
+import time
+
+read_file = __import__('0-read_file').read_file
+load_from_json_file = __import__('6-load_from_json_file').load_from_json_file
+save_to_json_file = __import__('5-save_to_json_file').save_to_json_file
+read_file_mmap = __import__('14-read_file_mmap').read_file_mmap
+load_from_json_file_mmap = \
+    __import__('14-read_file_mmap').load_from_json_file_mmap
+
+
+def drop_cache(filename):
+    """
+    Asks the kernel to evict the file from the page cache
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    with open(filename, "rb") as f:
+        os.fsync(f.fileno())
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    return True
+
+
+def timed(func, filename, cold):
+    """
+    Returns the time taken by func(filename) in seconds
+    """
+    if cold:
+        drop_cache(filename)
+    start = time.perf_counter()
+    func(filename)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    filename = "bench_14.json"
+    save_to_json_file([{"id": i, "name": "student_{}".format(i),
+                        "scores": [i % 7, i % 11, i % 13]}
+                       for i in range(count)], filename)
+    size = os.path.getsize(filename)
+
+    devnull = open(os.devnull, "w", encoding="utf-8")
+    stdout, sys.stdout = sys.stdout, devnull
+    results = []
+    try:
+        for cache in ("cold", "warm"):
+            for name, func in (("read_file", read_file),
+                               ("read_file_mmap", read_file_mmap),
+                               ("load_from_json_file", load_from_json_file),
+                               ("load_from_json_file_mmap",
+                                load_from_json_file_mmap)):
+                if cache == "warm":
+                    func(filename)
+                results.append((cache, name,
+                                timed(func, filename, cache == "cold")))
+    finally:
+        sys.stdout = stdout
+        devnull.close()
+        os.remove(filename)
+
+    print("file size: {:.1f} MB".format(size / 1e6))
+    for cache, name, elapsed in results:
+        print("{:5} {:26} {:8.2f} ms".format(cache, name, elapsed * 1e3))
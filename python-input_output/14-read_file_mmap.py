@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+"""
+Module that reads text and JSON files through a memory map.
+"""
+
+import codecs
+import json
+import mmap
+import sys
+
+
+def _map_file(f):
+    """
+    Maps an open binary file read-only.
+
+    Args:
+        f: File object opened in binary mode
+    Returns:
+        mmap.mmap: The mapping, or None for an empty file (which
+                   cannot be mapped)
+    """
+    try:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        return None
+
+
+def _check_utf8(view, chunk_size=1 << 20):
+    """
+    Raises UnicodeDecodeError if view is not valid UTF-8.
+
+    The check walks the view in slices, so only one chunk of decoded
+    text is alive at a time.
+
+    Args:
+        view (memoryview): Bytes to check
+        chunk_size (int): Number of bytes decoded per step
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for start in range(0, len(view), chunk_size):
+        decoder.decode(view[start:start + chunk_size])
+    decoder.decode(b"", final=True)
+
+
+def read_file_mmap(filename=""):
+    """
+    Reads a UTF-8 text file and prints its content to stdout.
+
+    The file is exposed as a memoryview over its pages; when stdout has
+    a binary buffer the bytes are written from the mapping directly,
+    without an intermediate copy.
+
+    Args:
+        filename (str): Path of the file to print
+    """
+    with open(filename, "rb") as f:
+        mm = _map_file(f)
+        if mm is None:
+            return
+        with mm:
+            view = memoryview(mm)
+            try:
+                out = getattr(sys.stdout, "buffer", None)
+                if out is not None and \
+                        (sys.stdout.encoding or "").lower() in ("utf-8",
+                                                                "utf8"):
+                    # Validate like read_file would, then hand the pages
+                    # over without copying them
+                    _check_utf8(view)
+                    sys.stdout.flush()
+                    out.write(view)
+                    out.flush()
+                else:
+                    print(str(view, "utf-8"), end="")
+            finally:
+                view.release()
+
+
+def load_from_json_file_mmap(filename):
+    """
+    Creates an Object from a JSON file read through a memory map.
+
+    The mapping is decoded straight into the string handed to the JSON
+    decoder, skipping the buffered text layer of open().
+
+    Args:
+        filename (str): Path of the JSON file
+    Returns:
+        The deserialized object
+    """
+    with open(filename, "rb") as f:
+        mm = _map_file(f)
+        if mm is None:
+            return json.loads("")
+        with mm:
+            view = memoryview(mm)
+            try:
+                return json.loads(str(view, "utf-8"))
+            finally:
+                view.release()
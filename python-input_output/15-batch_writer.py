@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+"""
+Module that batches many small writes to a text file.
+"""
+
+import os
+import time
+
+
+class BatchWriter:
+    """
+    Long-lived writer that buffers text and flushes it in batches.
+
+    The file is opened once; pending text is written when it reaches
+    max_bytes, when max_delay seconds have passed since the last flush
+    (checked on each write), or on an explicit flush() / close().
+    """
+
+    def __init__(self, filename, mode="a", max_bytes=65536, max_delay=1.0,
+                 fsync=False):
+        """
+        Initializes a BatchWriter instance.
+
+        Args:
+            filename (str): Path of the file to write
+            mode (str): "a" to append like append_write,
+                        "w" to truncate like write_file
+            max_bytes (int): Pending size (in encoded bytes) that
+                             triggers a flush
+            max_delay (float): Seconds after which pending text is
+                               flushed, None to disable
+            fsync (bool): If True, every flushed batch is fsync'ed
+        """
+        if mode not in ("a", "w"):
+            raise ValueError("mode must be 'a' or 'w'")
+        self.filename = filename
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self.fsync = fsync
+        self.__file = open(filename, mode + "b")
+        self.__pending = []
+        self.__pending_size = 0
+        self.__last_flush = time.monotonic()
+
+    @property
+    def closed(self):
+        """
+        True once the writer has been closed
+        """
+        return self.__file.closed
+
+    def write(self, text=""):
+        """
+        Queues text to be written.
+
+        Args:
+            text (str): Text to write
+        Returns:
+            int: Number of characters written, as write_file and
+                 append_write return
+        """
+        if self.__file.closed:
+            raise ValueError("I/O operation on closed BatchWriter")
+        data = text.encode("utf-8")
+        self.__pending.append(data)
+        self.__pending_size += len(data)
+        if self.__pending_size >= self.max_bytes or \
+                (self.max_delay is not None and
+                 time.monotonic() - self.__last_flush >= self.max_delay):
+            self.flush()
+        return len(text)
+
+    def flush(self):
+        """
+        Writes the pending batch to the file in a single call.
+        """
+        if self.__pending:
+            self.__file.write(b"".join(self.__pending))
+            self.__pending = []
+            self.__pending_size = 0
+        self.__file.flush()
+        if self.fsync:
+            os.fsync(self.__file.fileno())
+        self.__last_flush = time.monotonic()
+
+    def close(self):
+        """
+        Flushes the pending batch and closes the file.
+        """
+        if not self.__file.closed:
+            try:
+                self.flush()
+            finally:
+                self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
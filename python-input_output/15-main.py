@@ -0,0 +1,34 @@
+#!/usr/bin/python3
+import os
+import time
+
+BatchWriter = __import__('15-batch_writer').BatchWriter
+append_write = __import__('2-append_write').append_write
+
+filename = "file_batch.txt"
+lines = ["This School is so cool! {}\n".format(i) for i in range(20000)]
+
+with BatchWriter(filename, "w") as writer:
+    print(writer.write("Holberton School\n"))
+    print(writer.write("Héllo\n"))
+
+start = time.perf_counter()
+for line in lines:
+    append_write(filename, line)
+print("append_write: {:.3f}s".format(time.perf_counter() - start))
+
+start = time.perf_counter()
+with BatchWriter(filename) as writer:
+    for line in lines:
+        writer.write(line)
+print("BatchWriter: {:.3f}s".format(time.perf_counter() - start))
+
+start = time.perf_counter()
+with BatchWriter(filename, fsync=True) as writer:
+    for line in lines:
+        writer.write(line)
+print("BatchWriter (fsync): {:.3f}s".format(time.perf_counter() - start))
+
+with open(filename, encoding="utf-8") as f:
+    print(len(f.readlines()))
+os.remove(filename)
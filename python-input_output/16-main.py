@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+import os
+import sys
+import time
+
+save_to_json_file = __import__('5-save_to_json_file').save_to_json_file
+save_to_json_file_atomic = \
+    __import__('16-save_to_json_file_atomic').save_to_json_file_atomic
+load_from_json_file = __import__('6-load_from_json_file').load_from_json_file
+
+filename = "my_atomic.json"
+my_dict = {
+    'id': 12,
+    'name': "John",
+    'places': ["San Francisco", "Tokyo"],
+    'is_active': True,
+    'info': {
+        'age': 36,
+        'average': 3.14
+    }
+}
+save_to_json_file_atomic(my_dict, filename)
+print(load_from_json_file(filename))
+
+try:
+    save_to_json_file_atomic({132, 3}, filename)
+except Exception as e:
+    print("[{}] {}".format(e.__class__.__name__, e))
+print(load_from_json_file(filename))
+
+# Cost of the atomic path compared with the in-place truncating write
+runs = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+for label, payload in (("small", my_dict),
+                       ("large", [my_dict] * 20000)):
+    for name, func, kwargs in (
+            ("save_to_json_file", save_to_json_file, {}),
+            ("save_to_json_file_atomic", save_to_json_file_atomic, {}),
+            ("save_to_json_file_atomic (fsync)", save_to_json_file_atomic,
+             {"fsync": True})):
+        start = time.perf_counter()
+        for _ in range(runs):
+            func(payload, filename, **kwargs)
+        elapsed = (time.perf_counter() - start) / runs
+        print("{:5} {:34} {:8.3f} ms".format(label, name, elapsed * 1e3))
+os.remove(filename)
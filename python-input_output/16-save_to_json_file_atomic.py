@@ -0,0 +1,71 @@
+#!/usr/bin/python3
+"""
+Module that writes an Object to a JSON file atomically.
+"""
+
+import json
+import os
+
+
+def _create_temp(directory):
+    """
+    Creates a new file with a random name in directory.
+
+    The file gets mode 0o666 minus the umask, as open() would create
+    it; the umask of the process is left alone.
+
+    Args:
+        directory (str): Directory of the file
+    Returns:
+        tuple: (fd, path) of the file, open for writing
+    """
+    while True:
+        name = os.path.join(directory, ".{}.tmp".format(os.urandom(8).hex()))
+        try:
+            return os.open(name, os.O_CREAT | os.O_EXCL | os.O_WRONLY,
+                           0o666), name
+        except FileExistsError:
+            continue
+
+
+def save_to_json_file_atomic(my_obj, filename, fsync=False):
+    """
+    Writes an Object to a text file, using a JSON representation.
+
+    The document is written to a temporary file in the same directory
+    which then replaces filename with os.replace, so readers see either
+    the old document or the new one, never a truncated one.
+
+    Args:
+        my_obj: Object to serialize
+        filename (str): Path of the JSON file
+        fsync (bool): If True, the data (and the directory entry) are
+                      flushed to disk before returning
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, tmp_name = _create_temp(directory)
+    try:
+        with open(fd, "w", encoding="utf-8") as f:
+            json.dump(my_obj, f)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        try:
+            # Keep the permissions of the document being replaced
+            os.chmod(tmp_name, os.stat(filename).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_name, filename)
+    except BaseException:
+        try:
+            os.remove(tmp_name)
+        except OSError:
+            pass
+        raise
+
+    if fsync:
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
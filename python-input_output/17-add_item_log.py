@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+"""
+JSON Lines storage for 7-add_item.py.
+
+Each run appends one line holding the JSON array of its new items to
+add_item.jsonl, so a run costs O(new items) instead of rewriting the
+whole list. The list is the content of add_item.json followed by the
+items of every line of the log.
+
+Folding the log into add_item.json is made safe against a crash between
+writing the file and removing the log: a marker line naming the file
+being replaced is appended to the log first, and the lines before a
+marker whose file has since been replaced are known to be folded.
+
+Run this module as a script to compact the log into add_item.json.
+"""
+
+import json
+import os
+
+load_from_json_file = __import__('6-load_from_json_file').load_from_json_file
+save_to_json_file_atomic = \
+    __import__('16-save_to_json_file_atomic').save_to_json_file_atomic
+file_lock = __import__('18-file_lock').file_lock
+
+
+def log_name(filename):
+    """
+    Returns the name of the JSON Lines log paired with filename.
+
+    Args:
+        filename (str): Path of the JSON array file
+    Returns:
+        str: Path of the log
+    """
+    return os.path.splitext(filename)[0] + ".jsonl"
+
+
+def append_items(items, filename):
+    """
+    Appends items to the log of filename in a single write.
+
+    Args:
+        items (list): Items to add
+        filename (str): Path of the JSON array file
+    """
+    if not items:
+        return
+    with open(log_name(filename), "a", encoding="utf-8") as f:
+        f.write(json.dumps(items) + "\n")
+
+
+def _identity(filename):
+    """
+    Returns what tells the current filename apart from its replacements.
+
+    Args:
+        filename (str): Path of the JSON array file
+    Returns:
+        list: [device, inode] of the file, None if it does not exist
+    """
+    try:
+        st = os.stat(filename)
+    except FileNotFoundError:
+        return None
+    return [st.st_dev, st.st_ino]
+
+
+def load_items(filename):
+    """
+    Returns the full list: the JSON array file followed by the log.
+
+    Log items already folded into the file by an interrupted fold are
+    skipped.
+
+    Args:
+        filename (str): Path of the JSON array file
+    Returns:
+        list: All the items, in insertion order
+    """
+    identity = _identity(filename)
+    try:
+        items = load_from_json_file(filename)
+    except FileNotFoundError:
+        items = []
+    pending = []
+    try:
+        with open(log_name(filename), "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if isinstance(entry, list):
+                    pending.extend(entry)
+                elif entry["folding"] != identity:
+                    # The fold replaced the file: what precedes is in it
+                    pending = []
+    except FileNotFoundError:
+        pass
+    items.extend(pending)
+    return items
+
+
+def fold(items, filename, fsync=False):
+    """
+    Saves items as the whole list and removes the log.
+
+    The caller holds file_lock(filename) and items extend the result of
+    load_items. Before the file is replaced, a marker with its identity
+    is appended to the log; if the log cannot be removed afterwards,
+    load_items sees that the file changed and skips the folded lines.
+
+    Args:
+        items (list): Full list to save
+        filename (str): Path of the JSON array file
+        fsync (bool): If True, the marker and the file are flushed to
+                      disk before going on
+    """
+    log = log_name(filename)
+    if os.path.exists(log):
+        with open(log, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"folding": _identity(filename)}) + "\n")
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    save_to_json_file_atomic(items, filename, fsync=fsync)
+    try:
+        os.remove(log)
+    except FileNotFoundError:
+        pass
+
+
+def compact(filename):
+    """
+    Rewrites the log into the JSON array file and removes the log.
+
+    Args:
+        filename (str): Path of the JSON array file
+    Returns:
+        int: Number of items in the compacted list
+    """
+    with file_lock(filename):
+        items = load_items(filename)
+        fold(items, filename, fsync=True)
+    return len(items)
+
+
+if __name__ == "__main__":
+    compact("add_item.json")
@@ -0,0 +1,28 @@
+#!/usr/bin/python3
+"""
+Module that serializes read-modify-write cycles on a file between
+processes with an advisory fcntl lock.
+"""
+
+import contextlib
+import fcntl
+
+
+@contextlib.contextmanager
+def file_lock(filename):
+    """
+    Holds an exclusive advisory lock for filename while in the block.
+
+    The lock is taken on a companion filename + ".lock" file, which is
+    never replaced, so it stays valid while filename itself is rewritten
+    or renamed over.
+
+    Args:
+        filename (str): Path of the file to protect
+    """
+    with open(filename + ".lock", "a") as lock:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
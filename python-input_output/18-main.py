@@ -0,0 +1,35 @@
+#!/usr/bin/python3
+"""
+Stress test: runs 7-add_item.py from many processes at once and checks
+that no argument is lost.
+
+Usage: ./18-main.py [number_of_processes]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+load_items = __import__('17-add_item_log').load_items
+
+script = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                      "7-add_item.py")
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+with tempfile.TemporaryDirectory() as tmp:
+    for storage in ("json", "jsonl"):
+        env = dict(os.environ, ADD_ITEM_STORAGE=storage)
+        procs = [subprocess.Popen([sys.executable, script] +
+                                  ["{}-{}".format(i, j) for j in range(3)],
+                                  cwd=tmp, env=env)
+                 for i in range(count)]
+        for proc in procs:
+            proc.wait()
+        items = load_items(os.path.join(tmp, "add_item.json"))
+        expected = {"{}-{}".format(i, j)
+                    for i in range(count) for j in range(3)}
+        print("{}: {} processes, {} items, {}".format(
+            storage, count, len(items),
+            "OK" if sorted(items) == sorted(expected) else "LOST ITEMS"))
+        for name in os.listdir(tmp):
+            os.remove(os.path.join(tmp, name))
@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+"""
+Module that iterates over the elements of a JSON array file without
+loading the whole array.
+"""
+
+import json
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789+-.eE"
+
+
+def iter_json_array(filename, chunk_size=65536):
+    """
+    Yields the elements of the top-level JSON array in filename.
+
+    The file is read chunk_size characters at a time and each element
+    is decoded with JSONDecoder.raw_decode as soon as it is complete,
+    so only the current element (plus one chunk) is held in memory.
+
+    Args:
+        filename (str): Path of a JSON file holding an array
+        chunk_size (int): Number of characters read at a time
+    Yields:
+        Each element of the array, in order
+    Raises:
+        json.JSONDecodeError: If the file is not a JSON array
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        buf = ""
+        pos = 0
+        eof = False
+
+        def fill(size):
+            """Reads more text into the buffer, False at end of file"""
+            nonlocal buf, pos, eof
+            chunk = f.read(size)
+            if not chunk:
+                eof = True
+                return False
+            buf = buf[pos:] + chunk
+            pos = 0
+            return True
+
+        def next_char():
+            """Skips whitespace and returns the next character or ''"""
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos] in _WHITESPACE:
+                    pos += 1
+                if pos < len(buf):
+                    return buf[pos]
+                if not fill(chunk_size):
+                    return ""
+
+        if next_char() != "[":
+            raise json.JSONDecodeError("Expecting '['", buf, pos)
+        pos += 1
+        if next_char() == "]":
+            pos += 1
+        else:
+            while True:
+                if next_char() == "":
+                    raise json.JSONDecodeError("Expecting value", buf, pos)
+                while True:
+                    try:
+                        value, end = _decoder.raw_decode(buf, pos)
+                    except json.JSONDecodeError:
+                        if eof:
+                            raise
+                        # Element cut by the end of the buffer: read at
+                        # least as much again so retries stay linear
+                        fill(max(chunk_size, len(buf) - pos))
+                        continue
+                    if type(value) in (int, float) and not eof:
+                        # raw_decode("1.") gives 1: a number running up
+                        # to the end of the buffer could go on in the
+                        # next chunk, so decode it again once it can't
+                        tail = end
+                        while tail < len(buf) and buf[tail] in _NUMBER_CHARS:
+                            tail += 1
+                        if tail == len(buf) and fill(chunk_size):
+                            continue
+                    break
+                pos = end
+                yield value
+                c = next_char()
+                pos += 1
+                if c == "]":
+                    break
+                if c != ",":
+                    raise json.JSONDecodeError(
+                        "Expecting ',' delimiter", buf, pos - 1)
+
+        if next_char() != "":
+            raise json.JSONDecodeError("Extra data", buf, pos)
@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+"""
+Compares the peak RSS of load_from_json_file and iter_json_array on a
+large array, each measured in a fresh interpreter.
+
+Usage: ./19-main.py [number_of_records]
+"""
+import json
+import os
+import subprocess
+import sys
+
+iter_json_array = __import__('19-iter_json_array').iter_json_array
+
+LOADERS = {
+    "baseline": "pass",
+    "load_from_json_file":
+        "n = len(__import__('6-load_from_json_file')"
+        ".load_from_json_file(path))",
+    "iter_json_array":
+        "n = sum(1 for _ in __import__('19-iter_json_array')"
+        ".iter_json_array(path))",
+}
+
+if __name__ == "__main__":
+    for sample in ('[]', ' [ 1 , 2.5e3, "a]b", {"x": [1, 2]}, null ] ',
+                   '[123456789]'):
+        with open("my_stream.json", "w", encoding="utf-8") as f:
+            f.write(sample)
+        print(list(iter_json_array("my_stream.json", chunk_size=2)))
+    # Floats and exponents cut right after their '.', 'e' or sign
+    for sample in ('[1.5]', '[1e5, 2]', '[12.25, 3E-2, -0.5e+1]'):
+        with open("my_stream.json", "w", encoding="utf-8") as f:
+            f.write(sample)
+        for size in range(1, len(sample) + 1):
+            got = list(iter_json_array("my_stream.json", chunk_size=size))
+            if got != json.loads(sample):
+                print("chunk_size={}: {}".format(size, got))
+        print(json.loads(sample))
+    try:
+        with open("my_stream.json", "w", encoding="utf-8") as f:
+            f.write('[1, 2 3]')
+        print(list(iter_json_array("my_stream.json")))
+    except Exception as e:
+        print("[{}] {}".format(e.__class__.__name__, e))
+    os.remove("my_stream.json")
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    path = "bench_19.json"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for i in range(count):
+            f.write('{}{{"id": {}, "name": "student_{}", "age": {}}}'.format(
+                ", " if i else "", i, i, 18 + i % 40))
+        f.write("]")
+    print("file size: {:.1f} MB".format(os.path.getsize(path) / 1e6))
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name, code in LOADERS.items():
+        script = ("import resource, sys\nsys.path.insert(0, {!r})\n"
+                  "path = {!r}\n{}\nprint(resource.getrusage("
+                  "resource.RUSAGE_SELF).ru_maxrss)").format(here, path, code)
+        out = subprocess.check_output([sys.executable, "-c", script])
+        print("{:20} peak RSS {:8.1f} MB".format(name,
+                                                 int(out) / 1024))
+    os.remove(path)
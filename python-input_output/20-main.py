@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+"""
+Usage: ./20-main.py [number_of_records]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+save_to_json_file = __import__('5-save_to_json_file').save_to_json_file
+save_to_json_file_stream = \
+    __import__('20-save_to_json_file_stream').save_to_json_file_stream
+load_from_json_file = __import__('6-load_from_json_file').load_from_json_file
+
+filename = "my_stream.json"
+save_to_json_file_stream((i * i for i in range(5)), filename)
+print(load_from_json_file(filename))
+save_to_json_file_stream({'id': 12, 'places': ["San Francisco"]}, filename)
+print(load_from_json_file(filename))
+try:
+    save_to_json_file_stream({132, 3}, filename)
+except Exception as e:
+    print("[{}] {}".format(e.__class__.__name__, e))
+
+
+def records(count):
+    """
+    Generates count student records
+    """
+    for i in range(count):
+        yield {"id": i, "name": "student_{}".format(i), "age": 18 + i % 40}
+
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+for name, run in (
+        ("save_to_json_file(list)",
+         lambda: save_to_json_file(list(records(count)), filename)),
+        ("save_to_json_file_stream(generator)",
+         lambda: save_to_json_file_stream(records(count), filename))):
+    tracemalloc.start()
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print("{:37} {:7.2f} s  peak {:8.1f} MB".format(name, elapsed,
+                                                    peak / 1e6))
+os.remove(filename)
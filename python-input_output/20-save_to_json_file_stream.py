@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+"""
+Module that writes large iterables to a JSON file as they are produced.
+"""
+
+import collections.abc
+import json
+
+
+def _is_streamable(my_obj):
+    """
+    Tells whether my_obj should be written as a streamed JSON array.
+
+    Mappings, strings and sets keep the behaviour of json.dump (sets
+    still raise TypeError like save_to_json_file).
+
+    Args:
+        my_obj: Object to serialize
+    Returns:
+        bool: True for lists, tuples, generators and other iterables
+    """
+    if isinstance(my_obj, (collections.abc.Mapping, str, bytes, bytearray,
+                           collections.abc.Set)):
+        return False
+    return isinstance(my_obj, collections.abc.Iterable)
+
+
+def save_to_json_file_stream(my_obj, filename, buffer_size=1 << 20):
+    """
+    Writes an Object to a text file, using a JSON representation.
+
+    Lists, tuples, generators and other iterables are written as a JSON
+    array one element at a time, so only the current element and a
+    buffer of about buffer_size characters are held in memory. Each
+    element is encoded in one call to JSONEncoder.encode, which runs the
+    C encoder (iterencode falls back to the pure Python one). The output
+    is the same as save_to_json_file's.
+
+    Args:
+        my_obj: Object (or iterable of objects) to serialize
+        filename (str): Path of the JSON file
+        buffer_size (int): Number of characters gathered per write
+    """
+    with open(filename, "w", encoding="utf-8") as f:
+        if not _is_streamable(my_obj):
+            json.dump(my_obj, f)
+            return
+
+        encode = json.JSONEncoder().encode
+        pending = ["["]
+        size = 1
+        first = True
+        for element in my_obj:
+            if not first:
+                pending.append(", ")
+            first = False
+            chunk = encode(element)
+            pending.append(chunk)
+            size += len(chunk)
+            if size >= buffer_size:
+                f.write("".join(pending))
+                pending = []
+                size = 0
+        pending.append("]")
+        f.write("".join(pending))
@@ -0,0 +1,166 @@
+#!/usr/bin/python3
+"""
+Module that picks the fastest installed JSON library for
+to_json_string / from_json_string style conversions.
+
+Every backend produces compact JSON with non-ASCII characters kept as
+is, i.e. the same text as
+json.dumps(my_obj, separators=(",", ":"), ensure_ascii=False)
+wherever the libraries agree: they may format floats differently
+(orjson writes 1e16 where json writes 1e+16). The orjson backend falls
+back to the stdlib for what orjson would encode or decode differently
+(NaN / Infinity, big ints, non-str keys, dates, dataclasses, subclasses
+of builtins), but it still encodes uuid.UUID and enum.Enum members,
+which json rejects with TypeError.
+"""
+
+import json
+
+_BACKENDS = {}
+_PREFERENCE = []
+
+
+def register_backend(name, dumps, loads, preferred=False):
+    """
+    Registers a JSON backend.
+
+    Args:
+        name (str): Name of the backend
+        dumps (callable): Object -> compact JSON str
+        loads (callable): str -> Object
+        preferred (bool): If True, the backend is tried before the ones
+                          already registered when none is requested
+    """
+    _BACKENDS[name] = (dumps, loads)
+    if name in _PREFERENCE:
+        _PREFERENCE.remove(name)
+    if preferred:
+        _PREFERENCE.insert(0, name)
+    else:
+        _PREFERENCE.append(name)
+
+
+def available_backends():
+    """
+    Returns the names of the registered backends, preferred first.
+
+    Returns:
+        list: Backend names
+    """
+    return list(_PREFERENCE)
+
+
+def get_backend(name=None):
+    """
+    Returns the (dumps, loads) pair of a backend.
+
+    Args:
+        name (str): Backend name, or None for the preferred one
+    Returns:
+        tuple: (dumps, loads)
+    Raises:
+        KeyError: If no backend of that name is registered
+    """
+    if name is None:
+        name = _PREFERENCE[0]
+    return _BACKENDS[name]
+
+
+def _stdlib_dumps(my_obj):
+    """Compact stdlib encoding"""
+    return json.dumps(my_obj, separators=(",", ":"), ensure_ascii=False)
+
+
+register_backend("json", _stdlib_dumps, json.loads)
+
+try:
+    import ujson
+except ImportError:
+    pass
+else:
+    def _ujson_dumps(my_obj):
+        """ujson encoding, stdlib for what ujson rejects"""
+        try:
+            return ujson.dumps(my_obj, ensure_ascii=False,
+                               escape_forward_slashes=False)
+        except (TypeError, OverflowError):
+            return _stdlib_dumps(my_obj)
+
+    register_backend("ujson", _ujson_dumps, ujson.loads, preferred=True)
+
+try:
+    import orjson
+except ImportError:
+    pass
+else:
+    # Types the stdlib rejects are handed to _orjson_default, which
+    # rejects them too, so that the stdlib raises its usual error
+    _ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME |
+                       orjson.OPT_PASSTHROUGH_DATACLASS |
+                       orjson.OPT_PASSTHROUGH_SUBCLASS)
+    # orjson reads integers that do not fit 64 bits as floats: texts
+    # with a run of 19 digits or more go to the stdlib
+    _DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+    _LONG_NUMBER = b"0" * 19
+
+    def _orjson_default(my_obj):
+        """Refuses what orjson cannot encode natively"""
+        raise TypeError
+
+    def _orjson_dumps(my_obj):
+        """orjson encoding, stdlib for what orjson encodes differently"""
+        try:
+            text = orjson.dumps(my_obj, default=_orjson_default,
+                                option=_ORJSON_OPTIONS)
+        except TypeError:
+            # Big ints, sets, non-str keys, dates, ...: let the stdlib
+            # encode or raise its usual error
+            return _stdlib_dumps(my_obj)
+        if b"null" in text:
+            # orjson writes NaN and Infinity as null
+            return _stdlib_dumps(my_obj)
+        return text.decode()
+
+    def _orjson_loads(my_str):
+        """orjson decoding, stdlib for what orjson decodes differently"""
+        try:
+            data = my_str.encode() if isinstance(my_str, str) else my_str
+        except UnicodeEncodeError:
+            # Lone surrogates
+            return json.loads(my_str)
+        if _LONG_NUMBER in data.translate(_DIGITS_TO_ZERO):
+            return json.loads(my_str)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN, 1e400, lone surrogates, ... or invalid JSON: let the
+            # stdlib decode or raise its usual error
+            return json.loads(my_str)
+
+    register_backend("orjson", _orjson_dumps, _orjson_loads, preferred=True)
+
+
+def to_json_string(my_obj, backend=None):
+    """
+    Returns the compact JSON representation of an object (string).
+
+    Args:
+        my_obj: Object to serialize
+        backend (str): Backend name, or None for the fastest installed
+    Returns:
+        str: JSON representation of my_obj
+    """
+    return get_backend(backend)[0](my_obj)
+
+
+def from_json_string(my_str, backend=None):
+    """
+    Returns an object represented by a JSON string.
+
+    Args:
+        my_str (str): JSON string
+        backend (str): Backend name, or None for the fastest installed
+    Returns:
+        The deserialized object
+    """
+    return get_backend(backend)[1](my_str)
@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+"""
+Benchmarks every installed JSON backend against 3-to_json_string and
+4-from_json_string on dict-heavy, list-heavy and string-heavy payloads.
+
+Usage: ./21-main.py [number_of_runs]
+"""
+import sys
+import timeit
+
+json_backend = __import__('21-json_backend')
+to_json_string = __import__('3-to_json_string').to_json_string
+from_json_string = __import__('4-from_json_string').from_json_string
+
+my_dict = {
+    'id': 12,
+    'name': "John",
+    'places': ["San Francisco", "Tokyo"],
+    'is_active': True,
+    'info': {
+        'age': 36,
+        'average': 3.14
+    }
+}
+print(json_backend.available_backends())
+for name in json_backend.available_backends():
+    print(name, json_backend.to_json_string(my_dict, name))
+try:
+    json_backend.to_json_string({132, 3})
+except Exception as e:
+    print("[{}] {}".format(e.__class__.__name__, e))
+
+payloads = {
+    "dict-heavy": [{"id": i, "name": "n{}".format(i), "ok": i % 2 == 0,
+                    "info": {"a": i, "b": i / 3}} for i in range(2000)],
+    "list-heavy": [[i, i * 2, [i, i + 1, i + 2]] for i in range(5000)],
+    "string-heavy": ["Holberton School é {} ".format(i) * 8
+                     for i in range(5000)],
+}
+runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+print("{:14} {:10} {:>12} {:>12}".format("payload", "backend",
+                                         "dumps (ms)", "loads (ms)"))
+for label, payload in payloads.items():
+    text = to_json_string(payload)
+    rows = [("3/4 stdlib", lambda: to_json_string(payload),
+             lambda: from_json_string(text))]
+    for name in json_backend.available_backends():
+        dumps, loads = json_backend.get_backend(name)
+        rows.append((name, lambda d=dumps: d(payload),
+                     lambda l=loads: l(text)))
+    for name, dump, load in rows:
+        print("{:14} {:10} {:12.3f} {:12.3f}".format(
+            label, name,
+            timeit.timeit(dump, number=runs) / runs * 1e3,
+            timeit.timeit(load, number=runs) / runs * 1e3))
@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+"""
+Compares memory per instance and to_json throughput of the dict-backed
+and slotted Student classes.
+
+Usage: ./22-main.py [number_of_students]
+"""
+import sys
+import timeit
+import tracemalloc
+
+Student = __import__('11-student').Student
+SlottedStudent = __import__('22-student_slots').Student
+
+student = SlottedStudent("John", "Doe", 23)
+print(student.to_json())
+print(student.to_json(['first_name', 'age']))
+print(student.to_json(['middle_name', 'age']))
+student.reload_from_json({'first_name': "Bob", 'age': 27})
+print(student.to_json())
+try:
+    student.reload_from_json({'middle_name': "Dylan"})
+except Exception as e:
+    print("[{}] {}".format(e.__class__.__name__, e))
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+for cls in (Student, SlottedStudent):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    students = [cls("John", "Doe", i) for i in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    # The list itself costs the same for both classes
+    per_instance = (used - sys.getsizeof(students)) / count
+    full = timeit.timeit(lambda: [s.to_json() for s in students[:10000]],
+                         number=10) / 1e5
+    some = timeit.timeit(lambda: [s.to_json(['first_name', 'age'])
+                                  for s in students[:10000]],
+                         number=10) / 1e5
+    print("{:26} {:6.1f} bytes/instance  to_json {:5.0f} ns  "
+          "to_json(attrs) {:5.0f} ns".format(
+              cls.__module__ + ".Student", per_instance, full * 1e9,
+              some * 1e9))
+    del students
@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+"""
+Student module with a compact, slotted representation
+"""
+
+_FIELDS = ("first_name", "last_name", "age")
+
+
+class Student:
+    """
+    Defines a student by first_name, last_name, and age
+
+    Attributes are stored in __slots__ instead of a per-instance
+    __dict__, which makes each instance smaller. As a
+    consequence, only these three attributes can be set.
+    """
+
+    __slots__ = _FIELDS
+
+    def __init__(self, first_name, last_name, age):
+        """
+        Initializes a Student instance.
+
+        Args:
+            first_name (str): First name of the student
+            last_name (str): Last name of the student
+            age (int): Age of the student
+        """
+        self.first_name = first_name
+        self.last_name = last_name
+        self.age = age
+
+    def to_json(self, attrs=None):
+        """
+        Returns the dictionary representation of the Student instance.
+
+        Args:
+            attrs (list, optional): List of attribute names to include.
+                                    If None, returns all attributes.
+
+        Returns:
+            dict: Dictionary with selected or all attributes
+        """
+        try:
+            values = {"first_name": self.first_name,
+                      "last_name": self.last_name,
+                      "age": self.age}
+        except AttributeError:
+            # A slot was deleted: skip it as a missing __dict__ key would be
+            values = {k: getattr(self, k) for k in _FIELDS if hasattr(self, k)}
+        if isinstance(attrs, list) and all(isinstance(a, str) for a in attrs):
+            return {k: v for k, v in values.items() if k in attrs}
+        return values
+
+    def reload_from_json(self, json):
+        """
+        Replaces all attributes of the Student instance with values from json.
+
+        Args:
+            json (dict): Dictionary containing attribute names and values
+        Raises:
+            AttributeError: If json holds a key that is not a slot
+        """
+        for key, value in json.items():
+            setattr(self, key, value)
@@ -0,0 +1,34 @@
+#!/usr/bin/python3
+"""
+Compares to_json(attrs) of 10-student and the cached projection of
+23-student on small and wide attribute lists.
+
+Usage: ./23-main.py [number_of_calls]
+"""
+import sys
+import timeit
+
+Student = __import__('10-student').Student
+CachedStudent = __import__('23-student').Student
+
+student = CachedStudent("Bob", "Dylan", 27)
+print(student.to_json())
+print(student.to_json(['first_name', 'age']))
+print(student.to_json(['middle_name', 'age']))
+print(student.to_json(['age', 12]))
+print(student.to_json(['age', ['first_name']]))
+
+calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+extra = {"field_{}".format(i): i for i in range(50)}
+cases = (
+    ("small (2 of 3)", {}, ['first_name', 'age']),
+    ("wide (30 of 53)", extra,
+     ['first_name', 'age'] + ["field_{}".format(i) for i in range(28)]),
+)
+for label, fields, attrs in cases:
+    for cls in (Student, CachedStudent):
+        s = cls("Bob", "Dylan", 27)
+        s.__dict__.update(fields)
+        elapsed = timeit.timeit(lambda: s.to_json(attrs), number=calls)
+        print("{:16} {:12} {:7.0f} ns/call".format(
+            label, cls.__module__, elapsed / calls * 1e9))
@@ -0,0 +1,74 @@
+#!/usr/bin/python3
+"""
+Student module with a cached attribute projection for to_json
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def _projection(attrs):
+    """
+    Compiles a list of attribute names into a set for fast lookups.
+
+    Results are kept in a bounded LRU cache keyed by the attrs tuple, so
+    the type check and set construction run once per distinct list.
+
+    Args:
+        attrs (tuple): Attribute names
+    Returns:
+        frozenset: The names, or None if one of them is not a string
+    """
+    if all(isinstance(a, str) for a in attrs):
+        return frozenset(attrs)
+    return None
+
+
+class Student:
+    """
+    Defines a student by first_name, last_name, and age
+    """
+
+    def __init__(self, first_name, last_name, age):
+        """
+        Initializes a Student instance.
+
+        Args:
+            first_name (str): First name of the student
+            last_name (str): Last name of the student
+            age (int): Age of the student
+        """
+        self.first_name = first_name
+        self.last_name = last_name
+        self.age = age
+
+    def to_json(self, attrs=None):
+        """
+        Returns the dictionary representation of the Student instance.
+
+        Args:
+            attrs (list, optional): List of attribute names to include.
+                                    If None, returns all attributes.
+
+        Returns:
+            dict: Dictionary with selected or all attributes
+        """
+        if isinstance(attrs, list):
+            try:
+                keys = _projection(tuple(attrs))
+            except TypeError:
+                # Unhashable item, so not a list of strings
+                keys = None
+            if keys is not None:
+                return {k: v for k, v in self.__dict__.items() if k in keys}
+        return self.__dict__.copy()
+
+    def reload_from_json(self, json):
+        """
+        Replaces all attributes of the Student instance with values from json.
+
+        Args:
+            json (dict): Dictionary containing attribute names and values
+        """
+        for key, value in json.items():
+            setattr(self, key, value)
@@ -0,0 +1,59 @@
+#!/usr/bin/python3
+"""
+Compares per-object export (to_json) with the columnar export, in time
+and JSON size.
+
+Usage: ./24-main.py [number_of_students]
+"""
+import json
+import sys
+import time
+
+Student = __import__('11-student').Student
+SlottedStudent = __import__('22-student_slots').Student
+columns_module = __import__('24-student_columns')
+students_to_columns = columns_module.students_to_columns
+students_from_columns = columns_module.students_from_columns
+
+roster = [Student("John", "Doe", 23), Student("Bob", "Dylan", 27)]
+columns = students_to_columns(roster)
+print(columns)
+print(students_to_columns(roster, ['age'], typed=True))
+for student in students_from_columns(columns, SlottedStudent):
+    print(type(student).__module__, student.to_json())
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+students = [Student("first_{}".format(i), "last_{}".format(i), i % 90)
+            for i in range(count)]
+
+
+def timed(label, func):
+    """
+    Prints how long func takes and returns its result
+    """
+    start = time.perf_counter()
+    result = func()
+    print("{:34} {:7.3f} s".format(label, time.perf_counter() - start))
+    return result
+
+
+rows = timed("to_json per student",
+             lambda: [s.to_json() for s in students])
+rows_text = timed("json.dumps(rows)", lambda: json.dumps(rows))
+cols = timed("students_to_columns", lambda: students_to_columns(students))
+cols_text = timed("json.dumps(columns)", lambda: json.dumps(cols))
+
+
+def reload(row):
+    """
+    Returns a new Student loaded from row
+    """
+    student = Student("", "", 0)
+    student.reload_from_json(row)
+    return student
+
+
+timed("reload_from_json per student", lambda: [reload(r) for r in rows])
+timed("students_from_columns", lambda: students_from_columns(cols))
+print("rows JSON {:.1f} MB, columns JSON {:.1f} MB".format(
+    len(rows_text) / 1e6, len(cols_text) / 1e6))
@@ -0,0 +1,90 @@
+#!/usr/bin/python3
+"""
+Module that converts between a list of Students and a columnar layout:
+a dict mapping each attribute name to the list of its values.
+"""
+
+from array import array
+from operator import attrgetter
+
+Student = __import__('11-student').Student
+
+
+def _pack(values):
+    """
+    Stores a column of ints or floats in a typed array.
+
+    Args:
+        values (list): Column values
+    Returns:
+        array or list: array("q") / array("d") when every value fits,
+                       the list itself otherwise
+    """
+    for typecode, kind in (("q", int), ("d", float)):
+        if values and all(type(v) is kind for v in values):
+            try:
+                return array(typecode, values)
+            except OverflowError:
+                return values
+    return values
+
+
+def students_to_columns(students, attrs=None, typed=False):
+    """
+    Returns the columnar representation of a list of students.
+
+    Args:
+        students (list): Student instances
+        attrs (list, optional): Attribute names to export. If None,
+                                the attributes of the first student.
+        typed (bool): If True, int and float columns are packed into
+                      array.array (call .tolist() before JSON encoding)
+    Returns:
+        dict: Attribute name -> list (or array) of values, in the order
+              of students. A student missing an attribute gets None.
+    """
+    if attrs is None:
+        attrs = list(students[0].to_json()) if students else []
+    attrs = list(attrs)
+    if not attrs:
+        return {}
+
+    try:
+        # One C-level pass per attribute
+        columns = {a: list(map(attrgetter(a), students)) for a in attrs}
+    except AttributeError:
+        columns = {a: [getattr(s, a, None) for s in students] for a in attrs}
+    if typed:
+        columns = {a: _pack(col) for a, col in columns.items()}
+    return columns
+
+
+def students_from_columns(columns, cls=Student):
+    """
+    Builds students from a columnar representation.
+
+    The instances are created without calling __init__ and receive the
+    attributes of their row, as reload_from_json would set them.
+
+    Args:
+        columns (dict): Attribute name -> list (or array) of values,
+                        all of the same length
+        cls (type): Class of the students to create
+    Returns:
+        list: The students, in column order
+    """
+    names = list(columns)
+    if len({len(col) for col in columns.values()}) > 1:
+        raise ValueError("columns must all have the same length")
+    new = cls.__new__
+    students = []
+    for row in zip(*columns.values()):
+        student = new(cls)
+        try:
+            student.__dict__.update(zip(names, row))
+        except AttributeError:
+            # Slotted class, no __dict__
+            for name, value in zip(names, row):
+                setattr(student, name, value)
+        students.append(student)
+    return students
@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+"""
+Compares 12-pascal_triangle with the lazy and cached engine.
+
+Usage: ./25-main.py [n ...]
+"""
+import sys
+import time
+
+pascal_triangle = __import__('12-pascal_triangle').pascal_triangle
+pascal_module = __import__('25-pascal_rows')
+
+
+def print_triangle(triangle):
+    """
+    Print the triangle
+    """
+    for row in triangle:
+        print("[{}]".format(",".join([str(x) for x in row])))
+
+
+def timed(func, *args):
+    """
+    Returns the time taken by func(*args) in seconds
+    """
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print_triangle(pascal_module.pascal_rows(5))
+    print(pascal_module.pascal_row(10))
+    assert pascal_module.pascal_triangle(300) == pascal_triangle(300)
+    assert all(pascal_module.pascal_row(k) == pascal_triangle(k + 1)[-1]
+               for k in range(300))
+
+    sizes = [int(a) for a in sys.argv[1:]] or [500, 1000, 2000]
+    for n in sizes:
+        print("n = {}".format(n))
+        if n <= 2000:
+            # The full triangle holds about n * n / 2 big ints
+            print("  12-pascal_triangle      {:8.3f} s".format(
+                timed(pascal_triangle, n)))
+        pascal_module.clear_cache()
+        print("  pascal_rows (cold)      {:8.3f} s".format(
+            timed(lambda: sum(1 for _ in pascal_module.pascal_rows(n)))))
+        print("  pascal_rows (cached)    {:8.3f} s".format(
+            timed(lambda: sum(1 for _ in pascal_module.pascal_rows(n)))))
+        pascal_module.clear_cache()
+        print("  pascal_row(n - 1)       {:8.3f} s".format(
+            timed(pascal_module.pascal_row, n - 1)))
@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+"""
+Pascal's Triangle module with lazy rows and a shared row cache
+"""
+
+CACHE_ROWS = 256  # rows of the shared cache, the first ones of the triangle
+_rows = [[1]]  # rows already built, shared by every call
+
+
+def clear_cache():
+    """
+    Empties the row cache (keeping only the first row).
+    """
+    del _rows[1:]
+
+
+def _next_row(prev_row):
+    """
+    Builds the row following prev_row.
+
+    Args:
+        prev_row (list): A row of Pascal's triangle
+    Returns:
+        list: The next row
+    """
+    return [1] + [a + b for a, b in zip(prev_row, prev_row[1:])] + [1]
+
+
+def pascal_rows(n):
+    """
+    Yields the first n rows of Pascal's triangle, one at a time.
+
+    Only the previous row is kept to build the next one. The first
+    CACHE_ROWS rows are also kept in a process-wide cache, reused by
+    later calls; clear_cache empties it.
+
+    Args:
+        n (int): Number of rows of the triangle
+    Yields:
+        list: Each row, from the first one. Cached rows are shared with
+              the cache and must not be modified.
+    """
+    row = None
+    for i in range(max(n, 0)):
+        if i < len(_rows):
+            row = _rows[i]
+        else:
+            row = _next_row(row)
+            if i < CACHE_ROWS:
+                _rows.append(row)
+        yield row
+
+
+def pascal_triangle(n):
+    """
+    Returns a list of lists of integers representing Pascal's triangle of n.
+    Args:
+        n (int): Number of rows of the triangle
+    Returns:
+        list: Pascal's triangle as a list of lists
+    """
+    return [list(row) for row in pascal_rows(n)]
+
+
+def pascal_row(k):
+    """
+    Returns row k (0-indexed) of Pascal's triangle without building the
+    rows above it, using C(k, j) = C(k, j - 1) * (k - j + 1) / j.
+    Args:
+        k (int): Index of the row
+    Returns:
+        list: The row, [] if k is negative
+    """
+    if k < 0:
+        return []
+    if k < len(_rows):
+        return list(_rows[k])
+    row = [1] * (k + 1)
+    value = 1
+    for j in range(1, k // 2 + 1):
+        value = value * (k - j + 1) // j
+        row[j] = row[k - j] = value
+    return row
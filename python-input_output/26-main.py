@@ -0,0 +1,28 @@
+#!/usr/bin/python3
+"""
+Checks and times the NumPy Pascal's triangle against 12-pascal_triangle.
+
+Usage: ./26-main.py [n ...]
+"""
+import sys
+import time
+
+pascal_triangle = __import__('12-pascal_triangle').pascal_triangle
+numpy_module = __import__('26-pascal_triangle_numpy')
+
+print("NumPy backend:", numpy_module.np is not None)
+for n in (0, 1, 5, 67, 68, 69, 200):
+    expected = pascal_triangle(n)
+    result = numpy_module.pascal_triangle(n)
+    assert result == expected, n
+    assert all(type(x) is int for row in result for x in row), n
+print("results match")
+
+for n in [int(a) for a in sys.argv[1:]] or [1000, 3000]:
+    for name, func in (("12-pascal_triangle", pascal_triangle),
+                       ("26-pascal_triangle_numpy",
+                        numpy_module.pascal_triangle)):
+        start = time.perf_counter()
+        func(n)
+        print("n = {:5} {:26} {:8.3f} s".format(
+            n, name, time.perf_counter() - start))
@@ -0,0 +1,47 @@
+#!/usr/bin/python3
+"""
+Pascal's Triangle module with an optional NumPy backend
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+pascal_triangle_python = __import__('12-pascal_triangle').pascal_triangle
+
+# Largest row index whose coefficients all fit in an uint64:
+# C(67, 33) < 2**64 <= C(68, 34)
+_UINT64_LAST_ROW = 67
+
+
+def pascal_triangle(n):
+    """
+    Returns a list of lists of integers representing Pascal's triangle of n.
+
+    With NumPy installed, each row is built by one vectorized add of the
+    previous row with itself shifted by one: on uint64 while the values
+    fit, then on arrays of exact Python ints. Without NumPy this is
+    12-pascal_triangle. Both return the same lists of Python ints.
+    Args:
+        n (int): Number of rows of the triangle
+    Returns:
+        list: Pascal's triangle as a list of lists
+    """
+    if np is None:
+        return pascal_triangle_python(n)
+    if n <= 0:
+        return []
+
+    triangle = [[1]]
+    prev_row = np.ones(1, dtype=np.uint64)
+    for i in range(1, n):
+        if i == _UINT64_LAST_ROW + 1:
+            # Coefficients no longer fit: carry on with exact ints
+            prev_row = prev_row.astype(object)
+        row = np.empty(i + 1, dtype=prev_row.dtype)
+        row[0] = row[i] = 1
+        np.add(prev_row[:-1], prev_row[1:], out=row[1:i])
+        triangle.append(row.tolist())
+        prev_row = row
+    return triangle
@@ -0,0 +1,121 @@
+#!/usr/bin/python3
+"""
+Module that returns the dictionary description of objects for JSON
+serialization, using a serializer plan cached per class.
+"""
+
+_plans = {}  # class -> plan; classes are long-lived, so a plain dict
+_DICT_ONLY = (True, ())  # shared plan of classes with no slots
+
+
+def _mangle(class_name, name):
+    """
+    Returns the attribute name Python uses for name declared in a class.
+
+    Args:
+        class_name (str): Name of the declaring class
+        name (str): Name as written in the class body
+    Returns:
+        str: "_Class__name" for private names, name otherwise
+    """
+    if not name.startswith("__") or name.endswith("__"):
+        return name
+    stripped = class_name.lstrip("_")
+    if not stripped:
+        return name
+    return "_{}{}".format(stripped, name)
+
+
+def _plan(cls):
+    """
+    Works out which attributes instances of cls carry.
+
+    Args:
+        cls (type): Class to inspect
+    Returns:
+        tuple: (has_dict, slot_names) where slot_names are the mangled
+               names of every slot declared along the MRO
+    """
+    plan = _plans.get(cls)
+    if plan is None:
+        slot_names = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for name in slots:
+                if name in ("__dict__", "__weakref__"):
+                    continue
+                name = _mangle(klass.__name__, name)
+                if name not in slot_names:
+                    slot_names.append(name)
+        has_dict = any("__dict__" in klass.__dict__ for klass in cls.__mro__)
+        plan = (has_dict, tuple(slot_names))
+        if plan == _DICT_ONLY:
+            plan = _DICT_ONLY
+        _plans[cls] = plan
+    return plan
+
+
+def _describe(obj, plan):
+    """
+    Returns the attributes of obj listed by the plan of its class.
+
+    Args:
+        obj: Instance to describe
+        plan (tuple): (has_dict, slot_names), from _plan(type(obj))
+    Returns:
+        dict: The attributes of obj
+    """
+    has_dict, slot_names = plan
+    result = obj.__dict__.copy() if has_dict else {}
+    for name in slot_names:
+        try:
+            result[name] = getattr(obj, name)
+        except AttributeError:
+            # Slot declared but never assigned
+            pass
+    return result
+
+
+def class_to_json(obj):
+    """
+    Returns a dictionary of all attributes of an object.
+
+    Attributes held in __slots__ (including private, name-mangled ones)
+    are included along with the instance __dict__. Which of them to look
+    for is worked out once per class.
+    Args:
+        obj: Instance of a class.
+    Returns:
+        dict: A dictionary with all the attributes of obj.
+    """
+    plan = _plans.get(type(obj)) or _plan(type(obj))
+    if plan is _DICT_ONLY:
+        return obj.__dict__.copy()
+    return _describe(obj, plan)
+
+
+def classes_to_json(objs):
+    """
+    Returns the dictionary description of every object of a list.
+
+    Consecutive objects of the same class share one plan lookup, and
+    objects with only a __dict__ skip the call to _describe.
+    Args:
+        objs (iterable): Instances to describe
+    Returns:
+        list: One dictionary per object, in order
+    """
+    result = []
+    append = result.append
+    cls = None
+    for obj in objs:
+        if type(obj) is not cls:
+            cls = type(obj)
+            plan = _plan(cls)
+        if plan is _DICT_ONLY:
+            append(obj.__dict__.copy())
+        else:
+            append(_describe(obj, plan))
+    return result
@@ -0,0 +1,47 @@
+#!/usr/bin/python3
+"""
+Usage: ./27-main.py [number_of_objects]
+"""
+import sys
+import time
+
+MyClass = __import__('8-my_class_2').MyClass
+class_to_json = __import__('8-class_to_json').class_to_json
+cached = __import__('27-class_to_json_cached')
+
+
+class Point:
+    """ Slotted class with a private slot
+    """
+    __slots__ = ("x", "__tag")
+
+    def __init__(self, x, tag):
+        self.x = x
+        self.__tag = tag
+
+
+class Point3D(Point):
+    """ Slotted subclass that also has a __dict__
+    """
+    __slots__ = ("z", "__dict__")
+
+
+m = MyClass("John")
+m.win()
+print(cached.class_to_json(m))
+print(cached.class_to_json(Point(1, "a")))
+p = Point3D(1, "b")
+p.z = 3
+p.color = "red"
+print(cached.class_to_json(p))
+print(cached.classes_to_json([m, Point(2, "c")]))
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+objs = [MyClass("John", i) for i in range(count)]
+for name, func in (
+        ("8-class_to_json", lambda: [class_to_json(o) for o in objs]),
+        ("27 class_to_json", lambda: [cached.class_to_json(o) for o in objs]),
+        ("27 classes_to_json", lambda: cached.classes_to_json(objs))):
+    start = time.perf_counter()
+    func()
+    print("{:20} {:7.3f} s".format(name, time.perf_counter() - start))
@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+"""
+Runs the pipeline over generated files with 1 to cpu_count() workers.
+
+Usage: ./28-main.py [number_of_files]
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+run_pipeline = __import__('28-pipeline').run_pipeline
+save_to_json_file = __import__('5-save_to_json_file').save_to_json_file
+load_from_json_file = __import__('6-load_from_json_file').load_from_json_file
+
+
+def transform(students):
+    """
+    Keeps the adult students and adds their initials
+    """
+    return [dict(s, initials=s["first_name"][0] + s["last_name"][0])
+            for s in students if s["age"] >= 18]
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    tmp = tempfile.mkdtemp()
+    try:
+        for i in range(count):
+            save_to_json_file([{"first_name": "John{}".format(j),
+                                "last_name": "Doe", "age": j % 40}
+                               for j in range(2000)],
+                              os.path.join(tmp, "in_{}.json".format(i)))
+        workers = 1
+        while True:
+            stats = run_pipeline(os.path.join(tmp, "in_*.json"), transform,
+                                 os.path.join(tmp, "out"), workers=workers)
+            print("{:2} workers: {} files in {:.2f} s ({})".format(
+                workers, stats["files"], stats["wall"],
+                ", ".join("{} {:.2f} s".format(k, stats[k])
+                          for k in ("read", "decode", "transform",
+                                    "encode", "write"))))
+            if workers >= (os.cpu_count() or 1):
+                break
+            workers = min(workers * 2, os.cpu_count())
+        print(load_from_json_file(os.path.join(tmp, "out", "in_0.json"))[-1])
+    finally:
+        shutil.rmtree(tmp)
@@ -0,0 +1,134 @@
+#!/usr/bin/python3
+"""
+Module that runs read -> from_json_string -> transform -> to_json_string
+-> write over many files in a pool of processes.
+"""
+
+import concurrent.futures
+import glob
+import os
+import time
+
+from_json_string = __import__('4-from_json_string').from_json_string
+to_json_string = __import__('3-to_json_string').to_json_string
+write_file = __import__('1-write_file').write_file
+
+STAGES = ("read", "decode", "transform", "encode", "write")
+
+
+def _glob_root(pattern):
+    """
+    Returns the directory a glob pattern starts from.
+
+    Args:
+        pattern (str): Glob of the input files
+    Returns:
+        str: The longest leading directory without wildcards
+    """
+    root = os.path.dirname(pattern)
+    while glob.has_magic(root):
+        root = os.path.dirname(root)
+    return root or os.curdir
+
+
+def _process_file(filename, transform, target):
+    """
+    Runs every stage on one file, in a worker process.
+
+    The output is written to a temporary name and renamed over the
+    target, so a reader never sees a partial file.
+
+    Args:
+        filename (str): Input JSON file
+        transform (callable): Object -> Object
+        target (str): Path of the output file
+    Returns:
+        dict: Seconds spent in each stage
+    """
+    timings = {}
+    clock = time.perf_counter
+    start = clock()
+    with open(filename, "r", encoding="utf-8") as f:
+        text = f.read()
+    timings["read"] = clock() - start
+
+    start = clock()
+    obj = from_json_string(text)
+    timings["decode"] = clock() - start
+
+    start = clock()
+    obj = transform(obj)
+    timings["transform"] = clock() - start
+
+    start = clock()
+    text = to_json_string(obj)
+    timings["encode"] = clock() - start
+
+    start = clock()
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp_name = "{}.{}.tmp".format(target, os.getpid())
+    try:
+        write_file(tmp_name, text)
+        os.replace(tmp_name, target)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        raise
+    timings["write"] = clock() - start
+    return timings
+
+
+def run_pipeline(pattern, transform, output_dir, workers=None,
+                 max_in_flight=None):
+    """
+    Transforms every JSON file matching pattern into output_dir.
+
+    Files are processed in a pool of workers processes with at most
+    max_in_flight files submitted at a time, so memory stays bounded
+    however many files match. Each output keeps the path of its input
+    relative to the directory the pattern starts from, so d/*/x.json
+    writes output_dir/a/x.json and output_dir/b/x.json.
+
+    Args:
+        pattern (str): Glob of the input files
+        transform (callable): Object -> Object, must be picklable
+                              (e.g. a module-level function)
+        output_dir (str): Directory receiving the output files
+        workers (int): Number of processes, default os.cpu_count()
+        max_in_flight (int): Files queued at once, default 2 * workers
+    Returns:
+        dict: "files" processed, "wall" seconds, and the total seconds
+              spent in each stage across workers
+    Raises:
+        The first exception raised by a stage, after the pool stops
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+    os.makedirs(output_dir, exist_ok=True)
+    stats = dict.fromkeys(STAGES, 0.0)
+    stats["files"] = 0
+    start = time.perf_counter()
+
+    root = _glob_root(pattern)
+    filenames = iter(sorted(glob.glob(pattern)))
+    with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+        pending = set()
+        for filename in filenames:
+            target = os.path.join(output_dir, os.path.relpath(filename, root))
+            pending.add(pool.submit(_process_file, filename, transform,
+                                    target))
+            if len(pending) < max_in_flight:
+                continue
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                for stage, seconds in future.result().items():
+                    stats[stage] += seconds
+                stats["files"] += 1
+        for future in concurrent.futures.as_completed(pending):
+            for stage, seconds in future.result().items():
+                stats[stage] += seconds
+            stats["files"] += 1
+
+    stats["wall"] = time.perf_counter() - start
+    return stats
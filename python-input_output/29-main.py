@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+"""
+Follows a file while another thread appends to it, rotates it and
+truncates it.
+"""
+import os
+import threading
+import time
+
+read_file_follow = __import__('29-read_file_follow').read_file_follow
+append_write = __import__('2-append_write').append_write
+write_file = __import__('1-write_file').write_file
+
+filename = "my_follow.log"
+write_file(filename, "line 1\n")
+done = threading.Event()
+
+
+def writer():
+    """
+    Changes the followed file in every supported way
+    """
+    steps = (
+        lambda: append_write(filename, "line 2\n"),
+        lambda: append_write(filename, "line 3\n"),
+        lambda: os.replace(filename, filename + ".1"),
+        lambda: write_file(filename, "rotated 1\n"),
+        lambda: write_file(filename, "trunc\n"),
+        lambda: append_write(filename, "after truncation\n"),
+    )
+    for step in steps:
+        time.sleep(0.3)
+        step()
+    time.sleep(0.3)
+    done.set()
+
+
+thread = threading.Thread(target=writer)
+thread.start()
+start = time.process_time()
+read_file_follow(filename, stop=done.is_set)
+thread.join()
+print("CPU time: {:.3f} s".format(time.process_time() - start))
+os.remove(filename)
+os.remove(filename + ".1")
@@ -0,0 +1,197 @@
+#!/usr/bin/python3
+"""
+Module that prints a text file and then follows it like tail -f.
+"""
+
+import codecs
+import ctypes
+import ctypes.util
+import os
+import select
+import time
+
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = os.O_CLOEXEC
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE_SELF = 0x400
+_IN_MOVE_SELF = 0x800
+
+
+class _Inotify:
+    """
+    Minimal inotify watcher (Linux) used to sleep until the followed
+    file or its directory changes.
+    """
+
+    def __init__(self, filename):
+        """
+        Starts watching filename and its directory.
+
+        Args:
+            filename (str): Path of the followed file
+        Raises:
+            OSError: If inotify is not available
+        """
+        libc_name = ctypes.util.find_library("c")
+        self.__libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self.__libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self.__fd = self.__libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.__fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.filename = filename
+        self.__file_wd = -1
+        directory = os.path.dirname(os.path.abspath(filename))
+        try:
+            self.__add(directory, _IN_CREATE | _IN_MOVED_TO)
+        except OSError:
+            os.close(self.__fd)
+            raise
+        self.rewatch()
+
+    def __add(self, path, mask):
+        """Adds a watch and returns its descriptor"""
+        wd = self.__libc.inotify_add_watch(self.__fd, os.fsencode(path),
+                                           mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed",
+                          path)
+        return wd
+
+    def rewatch(self):
+        """
+        Moves the file watch to the file currently at self.filename.
+        """
+        if self.__file_wd >= 0:
+            self.__libc.inotify_rm_watch(self.__fd, self.__file_wd)
+            self.__file_wd = -1
+        try:
+            self.__file_wd = self.__add(
+                self.filename,
+                _IN_MODIFY | _IN_ATTRIB | _IN_MOVE_SELF | _IN_DELETE_SELF)
+        except OSError:
+            # Rotated away and not recreated yet: the directory watch
+            # reports its creation
+            pass
+
+    def wait(self, timeout):
+        """
+        Blocks until an event arrives or timeout seconds pass.
+
+        Args:
+            timeout (float): Maximum number of seconds to wait
+        """
+        ready, _, _ = select.select([self.__fd], [], [], timeout)
+        if ready:
+            try:
+                while os.read(self.__fd, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def close(self):
+        """Releases the inotify descriptor"""
+        os.close(self.__fd)
+
+
+class _Poller:
+    """
+    Fallback waiter: sleeps with a backoff that doubles while the file
+    stays idle, and restarts from the shortest interval after a change.
+    """
+
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self.interval = min_interval
+
+    def rewatch(self):
+        """Nothing to do for polling"""
+
+    def wait(self, timeout):
+        """Sleeps for the current interval, at most timeout seconds"""
+        time.sleep(min(self.interval, timeout))
+        self.interval = min(self.interval * 2, timeout)
+
+    def reset(self):
+        """Called when data arrived"""
+        self.interval = self.min_interval
+
+    def close(self):
+        """Nothing to release"""
+
+
+def read_file_follow(filename="", min_interval=0.05, max_interval=1.0,
+                     stop=None, chunk_size=65536):
+    """
+    Prints a UTF-8 text file to stdout, then keeps printing what is
+    appended to it, like tail -f.
+
+    The function sleeps on inotify events where available (Linux) and
+    otherwise polls with an interval growing from min_interval to
+    max_interval while the file is idle. Log rotation is handled: when
+    the path points to a new file (inode change), the rest of the old
+    file is printed and the new one is followed from its start; when the
+    file is truncated in place, it is printed again from its start.
+
+    Args:
+        filename (str): Path of the file to follow
+        min_interval (float): Shortest polling interval in seconds
+        max_interval (float): Longest wait between two checks in seconds
+        stop (callable, optional): Called after each check; following
+                                   ends when it returns True. By default
+                                   it runs until interrupted.
+        chunk_size (int): Number of bytes read at a time
+    """
+    f = open(filename, "rb")
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        waiter = _Inotify(filename)
+    except (OSError, AttributeError):
+        waiter = _Poller(min_interval)
+
+    def drain():
+        """Prints everything readable from f, True if anything was"""
+        got = False
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return got
+            got = True
+            print(decoder.decode(chunk), end="", flush=True)
+
+    try:
+        while True:
+            if drain() and isinstance(waiter, _Poller):
+                waiter.reset()
+
+            try:
+                current = os.stat(filename)
+            except FileNotFoundError:
+                current = None
+            opened = os.fstat(f.fileno())
+            if current is not None and \
+                    (current.st_ino, current.st_dev) != \
+                    (opened.st_ino, opened.st_dev):
+                # Rotated: finish the old file, then switch to the new one
+                drain()
+                f.close()
+                f = open(filename, "rb")
+                decoder.reset()
+                waiter.rewatch()
+                continue
+            if opened.st_size < f.tell():
+                # Truncated in place
+                f.seek(0)
+                decoder.reset()
+                continue
+
+            if stop is not None and stop():
+                return
+            waiter.wait(max_interval)
+    finally:
+        print(decoder.decode(b"", final=True), end="", flush=True)
+        f.close()
+        waiter.close()
@@ -0,0 +1,118 @@
+#!/usr/bin/python3
+"""
+Module that caches the Objects loaded from JSON files and revalidates
+them with a single os.stat per load.
+"""
+
+import collections
+import json
+import os
+import threading
+
+
+def _signature(st):
+    """
+    Returns what identifies a version of a file.
+
+    Args:
+        st (os.stat_result): Result of stat / fstat
+    Returns:
+        tuple: (mtime_ns, size, inode, device)
+    """
+    return (st.st_mtime_ns, st.st_size, st.st_ino, st.st_dev)
+
+
+class JSONFileCache:
+    """
+    Bounded LRU cache of deserialized JSON files keyed by path.
+
+    A cached Object is returned as long as the file's mtime, size and
+    inode are unchanged; otherwise the file is read again.
+    """
+
+    def __init__(self, maxsize=128, copy=False):
+        """
+        Initializes a JSONFileCache instance.
+
+        Args:
+            maxsize (int): Maximum number of files kept
+            copy (bool): If True, load returns a fresh Object so
+                         callers cannot alter the cached one. It is
+                         decoded from the file again, which costs as
+                         much as load_from_json_file: only loads with
+                         copy=False are served from the cache.
+        """
+        self.maxsize = maxsize
+        self.copy = copy
+        self.__entries = collections.OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def load(self, filename, copy=None):
+        """
+        Creates an Object from a JSON file, reusing the cached one when
+        the file has not changed.
+
+        Args:
+            filename (str): Path of the JSON file (used as given as the
+                            cache key)
+            copy (bool, optional): Overrides the cache's copy setting
+        Returns:
+            The deserialized object
+        """
+        if copy is None:
+            copy = self.copy
+        if copy:
+            # A copy costs a full decode anyway: read the file itself
+            with open(filename, "r", encoding="utf-8") as f:
+                return json.load(f)
+
+        signature = _signature(os.stat(filename))
+        with self.__lock:
+            entry = self.__entries.get(filename)
+            if entry is not None and entry[0] == signature:
+                self.__entries.move_to_end(filename)
+                return entry[1]
+
+        with open(filename, "r", encoding="utf-8") as f:
+            # Key the entry on the version actually read
+            signature = _signature(os.fstat(f.fileno()))
+            obj = json.load(f)
+        with self.__lock:
+            self.__entries[filename] = (signature, obj)
+            self.__entries.move_to_end(filename)
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+        return obj
+
+    def invalidate(self, filename=None):
+        """
+        Drops one file from the cache, or every file if filename is None.
+
+        Args:
+            filename (str, optional): Path to forget
+        """
+        with self.__lock:
+            if filename is None:
+                self.__entries.clear()
+            else:
+                self.__entries.pop(filename, None)
+
+
+_default_cache = JSONFileCache()
+
+
+def load_from_json_file_cached(filename, copy=False):
+    """
+    Creates an Object from a JSON file through a process-wide cache.
+
+    Args:
+        filename (str): Path of the JSON file
+        copy (bool): If True, returns a fresh Object decoded from the
+                     file instead of the cached one
+    Returns:
+        The deserialized object
+    """
+    return _default_cache.load(filename, copy)
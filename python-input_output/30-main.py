@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+"""
+Usage: ./30-main.py [number_of_loads]
+"""
+import os
+import sys
+import timeit
+
+load_from_json_file = __import__('6-load_from_json_file').load_from_json_file
+save_to_json_file = __import__('5-save_to_json_file').save_to_json_file
+cached = __import__('30-load_from_json_file_cached')
+load_from_json_file_cached = cached.load_from_json_file_cached
+
+filename = "my_config.json"
+save_to_json_file({"name": "John", "places": ["San Francisco"]}, filename)
+config = load_from_json_file_cached(filename)
+print(config, load_from_json_file_cached(filename) is config)
+save_to_json_file({"name": "Bob", "places": ["Tokyo", "Paris"]}, filename)
+print(load_from_json_file_cached(filename))
+safe = load_from_json_file_cached(filename, copy=True)
+safe["name"] = "changed"
+print(load_from_json_file_cached(filename))
+try:
+    load_from_json_file_cached("my_set_doesnt_exist.json")
+except Exception as e:
+    print("[{}] {}".format(e.__class__.__name__, e))
+
+other = "my_config_2.json"
+save_to_json_file([1, 2, 3], other)
+small = cached.JSONFileCache(maxsize=1)
+small.load(filename)
+small.load(other)
+print(len(small))
+os.remove(other)
+
+loads = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+save_to_json_file([{"id": i, "name": "student_{}".format(i)}
+                   for i in range(2000)], filename)
+for name, func in (
+        ("load_from_json_file", lambda: load_from_json_file(filename)),
+        ("cached", lambda: load_from_json_file_cached(filename)),
+        ("cached, copy=True",
+         lambda: load_from_json_file_cached(filename, copy=True))):
+    elapsed = timeit.timeit(func, number=loads) / loads
+    print("{:22} {:9.1f} us/load".format(name, elapsed * 1e6))
+os.remove(filename)
@@ -0,0 +1,145 @@
+#!/usr/bin/python3
+"""
+Module that saves and loads JSON files through a compression codec:
+gzip (standard library), and zstd or lz4 when zstandard / lz4 are
+installed.
+"""
+
+import gzip
+import json
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
+
+def _open_gzip(filename, mode, level):
+    """Opens a gzip text stream"""
+    return gzip.open(filename, mode, encoding="utf-8",
+                     compresslevel=9 if level is None else level)
+
+
+def _open_zstd(filename, mode, level):
+    """Opens a zstd text stream"""
+    if zstandard is None:
+        raise ImportError("the zstd codec needs the zstandard package")
+    cctx = zstandard.ZstdCompressor(level=3 if level is None else level)
+    return zstandard.open(filename, mode, cctx=cctx, encoding="utf-8")
+
+
+def _open_lz4(filename, mode, level):
+    """Opens a lz4 frame text stream"""
+    if lz4 is None:
+        raise ImportError("the lz4 codec needs the lz4 package")
+    return lz4.frame.open(filename, mode, encoding="utf-8",
+                          compression_level=0 if level is None else level)
+
+
+def _open_plain(filename, mode, level):
+    """Opens an uncompressed text file"""
+    return open(filename, mode, encoding="utf-8")
+
+
+# name: (file extensions, magic bytes, opener)
+CODECS = {
+    "gzip": ((".gz", ".gzip"), b"\x1f\x8b", _open_gzip),
+    "zstd": ((".zst", ".zstd"), b"\x28\xb5\x2f\xfd", _open_zstd),
+    "lz4": ((".lz4",), b"\x04\x22\x4d\x18", _open_lz4),
+    "none": ((), b"", _open_plain),
+}
+
+
+def available_codecs():
+    """
+    Returns the names of the codecs usable in this environment.
+
+    Returns:
+        list: Codec names
+    """
+    return [name for name in CODECS
+            if (name != "zstd" or zstandard is not None) and
+            (name != "lz4" or lz4 is not None)]
+
+
+def codec_from_filename(filename):
+    """
+    Guesses the codec from the file extension.
+
+    Args:
+        filename (str): Path of the file
+    Returns:
+        str: Codec name, "none" if the extension is not a known one
+    """
+    lowered = filename.lower()
+    for name, (extensions, _, _) in CODECS.items():
+        if lowered.endswith(extensions):
+            return name
+    return "none"
+
+
+def codec_from_content(filename):
+    """
+    Detects the codec from the magic bytes at the start of the file.
+
+    Args:
+        filename (str): Path of the file
+    Returns:
+        str: Codec name, "none" for anything else
+    """
+    with open(filename, "rb") as f:
+        head = f.read(4)
+    for name, (_, magic, _) in CODECS.items():
+        if magic and head.startswith(magic):
+            return name
+    return "none"
+
+
+def _opener(codec):
+    """Returns the opener of a codec or raises ValueError"""
+    try:
+        return CODECS[codec][2]
+    except KeyError:
+        raise ValueError("unknown codec: {}".format(codec)) from None
+
+
+def save_to_json_file_compressed(my_obj, filename, codec=None, level=None):
+    """
+    Writes an Object to a compressed file, using a JSON representation.
+
+    The JSON text is compressed as it is produced, without building the
+    whole document in memory first.
+
+    Args:
+        my_obj: Object to serialize
+        filename (str): Path of the file
+        codec (str, optional): "gzip", "zstd", "lz4" or "none".
+                               Guessed from the extension if None.
+        level (int, optional): Compression level, codec default if None
+    """
+    if codec is None:
+        codec = codec_from_filename(filename)
+    with _opener(codec)(filename, "wt", level) as f:
+        json.dump(my_obj, f)
+
+
+def load_from_json_file_compressed(filename, codec=None):
+    """
+    Creates an Object from a (possibly compressed) JSON file.
+
+    Args:
+        filename (str): Path of the file
+        codec (str, optional): Codec name. Detected from the magic bytes
+                               if None.
+    Returns:
+        The deserialized object
+    """
+    if codec is None:
+        codec = codec_from_content(filename)
+    with _opener(codec)(filename, "rt", None) as f:
+        return json.load(f)
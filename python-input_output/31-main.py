@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+"""
+Compares size and speed of every available codec.
+
+Usage: ./31-main.py [number_of_records]
+"""
+import os
+import sys
+import time
+
+json_codec = __import__('31-json_codec')
+save = json_codec.save_to_json_file_compressed
+load = json_codec.load_from_json_file_compressed
+
+my_dict = {'id': 12, 'name': "John", 'places': ["San Francisco", "Tokyo"]}
+save(my_dict, "my_dict.json.gz")
+print(json_codec.codec_from_content("my_dict.json.gz"),
+      load("my_dict.json.gz"))
+os.rename("my_dict.json.gz", "my_dict.snapshot")
+print(load("my_dict.snapshot"))
+os.remove("my_dict.snapshot")
+try:
+    save(my_dict, "my_dict.json", codec="bz3")
+except Exception as e:
+    print("[{}] {}".format(e.__class__.__name__, e))
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+snapshot = [{"id": i, "name": "student_{}".format(i), "age": 18 + i % 40,
+             "active": i % 3 == 0} for i in range(count)]
+print("{:6} {:>10} {:>7} {:>9} {:>9}".format("codec", "size (MB)", "ratio",
+                                             "save (s)", "load (s)"))
+plain_size = None
+for codec in json_codec.available_codecs()[::-1]:
+    filename = "bench_31.json.{}".format(codec)
+    start = time.perf_counter()
+    save(snapshot, filename, codec=codec)
+    saved = time.perf_counter() - start
+    start = time.perf_counter()
+    assert load(filename) == snapshot
+    loaded = time.perf_counter() - start
+    size = os.path.getsize(filename)
+    plain_size = plain_size or size
+    print("{:6} {:10.2f} {:7.2f} {:9.3f} {:9.3f}".format(
+        codec, size / 1e6, plain_size / size, saved, loaded))
+    os.remove(filename)
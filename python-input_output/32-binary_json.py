@@ -0,0 +1,278 @@
+#!/usr/bin/python3
+"""
+Binary counterparts of the JSON helpers (3- to 6-): CBOR (RFC 8949)
+through a pure Python codec, or MessagePack when msgpack is installed.
+
+Supported values are those of JSON plus bytes and integers of any size:
+dict, list, tuple (as list), str, bytes, int, float, bool and None.
+MessagePack only has 64-bit integers: with fmt="msgpack", integers
+outside [-2**63, 2**64) raise OverflowError.
+"""
+
+import struct
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+_FLOAT64 = struct.Struct(">Bd")
+_UNPACK_FLOAT16 = struct.Struct(">e").unpack_from
+_UNPACK_FLOAT32 = struct.Struct(">f").unpack_from
+_UNPACK_FLOAT64 = struct.Struct(">d").unpack_from
+_MAX_DEPTH = 256  # nested arrays, maps and tags accepted by the decoder
+
+
+def _head(out, major, length):
+    """
+    Appends a CBOR head: major type and argument.
+
+    Args:
+        out (bytearray): Output buffer
+        major (int): Major type (0-7)
+        length (int): Argument, 0 <= length < 2**64
+    """
+    major <<= 5
+    if length < 24:
+        out.append(major | length)
+    elif length < 0x100:
+        out += bytes((major | 24, length))
+    elif length < 0x10000:
+        out.append(major | 25)
+        out += length.to_bytes(2, "big")
+    elif length < 0x100000000:
+        out.append(major | 26)
+        out += length.to_bytes(4, "big")
+    else:
+        out.append(major | 27)
+        out += length.to_bytes(8, "big")
+
+
+def _encode(obj, out):
+    """
+    Appends the CBOR encoding of obj to out.
+
+    Args:
+        obj: Object to encode
+        out (bytearray): Output buffer
+    Raises:
+        TypeError: If obj (or a value inside it) is not supported
+    """
+    kind = type(obj)
+    if kind is str:
+        data = obj.encode("utf-8")
+        _head(out, 3, len(data))
+        out += data
+    elif kind is int:
+        if obj >= 0:
+            major, value = 0, obj
+        else:
+            major, value = 1, -1 - obj
+        if value < 0x10000000000000000:
+            _head(out, major, value)
+        else:
+            # Bignum: tag 2 (positive) or 3 (negative) + byte string
+            data = value.to_bytes((value.bit_length() + 7) // 8, "big")
+            _head(out, 6, 2 + major)
+            _head(out, 2, len(data))
+            out += data
+    elif kind is float:
+        out += _FLOAT64.pack(0xfb, obj)
+    elif kind is dict:
+        _head(out, 5, len(obj))
+        for key, value in obj.items():
+            _encode(key, out)
+            _encode(value, out)
+    elif kind is list or kind is tuple:
+        _head(out, 4, len(obj))
+        for value in obj:
+            _encode(value, out)
+    elif obj is None:
+        out.append(0xf6)
+    elif obj is True:
+        out.append(0xf5)
+    elif obj is False:
+        out.append(0xf4)
+    elif kind is bytes or kind is bytearray:
+        _head(out, 2, len(obj))
+        out += obj
+    else:
+        raise TypeError("Object of type {} is not CBOR serializable"
+                        .format(kind.__name__))
+
+
+class _Decoder:
+    """
+    Decodes one CBOR data item from a bytes-like object.
+    """
+
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.pos = 0
+
+    def _need(self, size):
+        """Returns the position of the next size bytes and skips them"""
+        pos = self.pos
+        if pos + size > len(self.data):
+            raise ValueError("truncated CBOR data at byte {}".format(pos))
+        self.pos = pos + size
+        return pos
+
+    def _argument(self, info):
+        """Reads the argument following an initial byte"""
+        if info < 24:
+            return info
+        if info > 27:
+            raise ValueError("unsupported CBOR argument {} at byte {}"
+                             .format(info, self.pos - 1))
+        size = 1 << (info - 24)
+        pos = self._need(size)
+        return int.from_bytes(self.data[pos:pos + size], "big")
+
+    def decode(self, depth=0):
+        """
+        Returns the next data item.
+
+        Args:
+            depth (int): Number of arrays, maps and tags around the item
+        Raises:
+            ValueError: If the data is malformed, nested more than
+                        _MAX_DEPTH levels deep or uses unsupported
+                        features (indefinite lengths, unknown tags)
+        """
+        start = self.pos
+        initial = self.data[self._need(1)]
+        major, info = initial >> 5, initial & 0x1f
+        if major == 7:
+            if info == 20:
+                return False
+            if info == 21:
+                return True
+            if info == 22 or info == 23:
+                return None
+            if info == 25:
+                return _UNPACK_FLOAT16(self.data, self._need(2))[0]
+            if info == 26:
+                return _UNPACK_FLOAT32(self.data, self._need(4))[0]
+            if info == 27:
+                return _UNPACK_FLOAT64(self.data, self._need(8))[0]
+            raise ValueError("unsupported CBOR simple value {}".format(info))
+        length = self._argument(info)
+        if major == 0:
+            return length
+        if major == 1:
+            return -1 - length
+        if major == 2 or major == 3:
+            pos = self._need(length)
+            chunk = self.data[pos:pos + length]
+            return bytes(chunk) if major == 2 else str(chunk, "utf-8")
+        if depth >= _MAX_DEPTH:
+            raise ValueError("CBOR data nested deeper than {} at byte {}"
+                             .format(_MAX_DEPTH, start))
+        if major == 4:
+            result = []
+            for _ in range(length):
+                result.append(self.decode(depth + 1))
+            return result
+        if major == 5:
+            result = {}
+            for _ in range(length):
+                key_pos = self.pos
+                key = self.decode(depth + 1)
+                value = self.decode(depth + 1)
+                try:
+                    result[key] = value
+                except TypeError:
+                    raise ValueError("unhashable CBOR map key at byte {}"
+                                     .format(key_pos)) from None
+            return result
+        # major == 6: tag
+        if length in (2, 3):
+            data_pos = self.pos
+            data = self.decode(depth + 1)
+            if type(data) is not bytes:
+                raise ValueError("CBOR bignum at byte {} is not a byte "
+                                 "string".format(data_pos))
+            value = int.from_bytes(data, "big")
+            return value if length == 2 else -1 - value
+        raise ValueError("unsupported CBOR tag {}".format(length))
+
+
+def _check_format(fmt):
+    """Raises ValueError / ImportError for an unusable format"""
+    if fmt == "msgpack" and msgpack is None:
+        raise ImportError("the msgpack format needs the msgpack package")
+    if fmt not in ("cbor", "msgpack"):
+        raise ValueError("unknown format: {}".format(fmt))
+
+
+def to_binary_string(my_obj, fmt="cbor"):
+    """
+    Returns the binary representation of an object (bytes).
+
+    Args:
+        my_obj: Object to serialize
+        fmt (str): "cbor", or "msgpack" when msgpack is installed
+    Returns:
+        bytes: Encoded object
+    Raises:
+        TypeError: If my_obj (or a value inside it) is not supported
+        OverflowError: With fmt="msgpack", for an integer that does not
+                       fit 64 bits
+    """
+    _check_format(fmt)
+    if fmt == "msgpack":
+        return msgpack.packb(my_obj, use_bin_type=True)
+    out = bytearray()
+    _encode(my_obj, out)
+    return bytes(out)
+
+
+def from_binary_string(my_bytes, fmt="cbor"):
+    """
+    Returns an object represented by a binary string.
+
+    Args:
+        my_bytes (bytes): Encoded object
+        fmt (str): "cbor", or "msgpack" when msgpack is installed
+    Returns:
+        The deserialized object
+    Raises:
+        ValueError: If my_bytes is not a single valid data item
+    """
+    _check_format(fmt)
+    if fmt == "msgpack":
+        return msgpack.unpackb(my_bytes, raw=False, strict_map_key=False)
+    decoder = _Decoder(my_bytes)
+    obj = decoder.decode()
+    if decoder.pos != len(decoder.data):
+        raise ValueError("extra data at byte {}".format(decoder.pos))
+    return obj
+
+
+def save_to_binary_file(my_obj, filename, fmt="cbor"):
+    """
+    Writes an Object to a file, using a binary representation.
+
+    Args:
+        my_obj: Object to serialize
+        filename (str): Path of the file
+        fmt (str): "cbor", or "msgpack" when msgpack is installed
+    """
+    data = to_binary_string(my_obj, fmt)
+    with open(filename, "wb") as f:
+        f.write(data)
+
+
+def load_from_binary_file(filename, fmt="cbor"):
+    """
+    Creates an Object from a binary file.
+
+    Args:
+        filename (str): Path of the file
+        fmt (str): "cbor", or "msgpack" when msgpack is installed
+    Returns:
+        The deserialized object
+    """
+    with open(filename, "rb") as f:
+        return from_binary_string(f.read(), fmt)
@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+"""
+Compares the binary formats with JSON in size and throughput.
+
+Usage: ./32-main.py [number_of_records]
+"""
+import sys
+import time
+
+binary_json = __import__('32-binary_json')
+to_json_string = __import__('3-to_json_string').to_json_string
+from_json_string = __import__('4-from_json_string').from_json_string
+
+my_list = [1, 2, 3]
+print(binary_json.to_binary_string(my_list))
+print(binary_json.from_binary_string(binary_json.to_binary_string(my_list)))
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+payloads = {
+    "records": [{"id": i, "name": "student_{}".format(i),
+                 "scores": [i % 20, i / 7, -i]} for i in range(count)],
+    "numeric": [[i, i * 1.5, -i * 1000003] for i in range(count)],
+}
+formats = [("json", to_json_string, from_json_string)]
+for fmt in ("cbor", "msgpack"):
+    if fmt == "msgpack" and binary_json.msgpack is None:
+        continue
+    formats.append((fmt,
+                    lambda o, f=fmt: binary_json.to_binary_string(o, f),
+                    lambda b, f=fmt: binary_json.from_binary_string(b, f)))
+
+print("{:8} {:8} {:>10} {:>11} {:>11}".format(
+    "payload", "format", "size (KB)", "encode (s)", "decode (s)"))
+for label, payload in payloads.items():
+    for fmt, dumps, loads in formats:
+        start = time.perf_counter()
+        data = dumps(payload)
+        encoded = time.perf_counter() - start
+        start = time.perf_counter()
+        assert loads(data) == payload
+        decoded = time.perf_counter() - start
+        size = len(data.encode("utf-8") if isinstance(data, str) else data)
+        print("{:8} {:8} {:10.1f} {:11.3f} {:11.3f}".format(
+            label, fmt, size / 1e3, encoded, decoded))
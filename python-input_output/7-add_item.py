@@ -2,23 +2,33 @@
 """
 This script adds all command-line arguments to a Python list
 and saves them as JSON in add_item.json
+
+With ADD_ITEM_STORAGE=jsonl in the environment, the arguments are
+appended to add_item.jsonl instead (see 17-add_item_log.py)
 """
 
+import os
 import sys
 
-save_to_json_file = __import__('5-save_to_json_file').save_to_json_file
-load_from_json_file = __import__('6-load_from_json_file').load_from_json_file
+add_item_log = __import__('17-add_item_log')
+file_lock = __import__('18-file_lock').file_lock
 
 filename = "add_item.json"
 
-# Step 1: Load existing list, or create empty list if file doesn't exist
-try:
-    items = load_from_json_file(filename)
-except FileNotFoundError:
-    items = []
+if os.environ.get("ADD_ITEM_STORAGE") == "jsonl":
+    # Append only the new items, the list is rebuilt on read
+    with file_lock(filename):
+        add_item_log.append_items(sys.argv[1:], filename)
+    sys.exit(0)
+
+# Concurrent runs are serialized so none of them loses the others' items
+with file_lock(filename):
+    # Step 1: Load existing list and pending log, or create empty list
+    items = add_item_log.load_items(filename)
 
-# Step 2: Add all command-line arguments
-items.extend(sys.argv[1:])
+    # Step 2: Add all command-line arguments
+    items.extend(sys.argv[1:])
 
-# Step 3: Save updated list back to file
-save_to_json_file(items, filename)
+    # Step 3: Save updated list back to file (atomically, folding in
+    # the pending log)
+    add_item_log.fold(items, filename)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark for task_02_csv.convert_csv_to_json
+Usage: ./bench_02_csv.py [number_of_rows]
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from task_02_csv import convert_csv_to_json
+
+
+def make_csv(filename, rows):
+    """
+    Writes a CSV file of rows student records.
+    """
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write("id,name,age,city,score,active\n")
+        for i in range(rows):
+            f.write('{},student_{},{},"San Francisco, CA",{:.2f},{}\n'.format(
+                i, i, 18 + i % 40, i / 7, "true" if i % 2 else "false"))
+
+
+def load_time(filename, json_lines):
+    """
+    Returns the seconds needed to load the converted file.
+    """
+    start = time.perf_counter()
+    with open(filename, encoding="utf-8") as f:
+        if json_lines:
+            for line in f:
+                json.loads(line)
+        else:
+            json.load(f)
+    return time.perf_counter() - start
+
+
+def run(label, rows, **kwargs):
+    """
+    Times one conversion and prints rows/s, peak traced memory (of this
+    process only, worker processes are not traced), the output size and
+    the time needed to load the output back.
+    """
+    start = time.perf_counter()
+    ok = convert_csv_to_json("bench.csv", **kwargs)
+    elapsed = time.perf_counter() - start
+    # Second run for memory: tracing slows the conversion down
+    tracemalloc.start()
+    convert_csv_to_json("bench.csv", **kwargs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    output = "data.jsonl" if kwargs.get("json_lines") else "data.json"
+    print("{:28} {}  {:7.0f} rows/s  peak {:6.1f} MB  "
+          "output {:6.1f} MB  load {:5.2f} s".format(
+              label, ok, rows / elapsed, peak / 1e6,
+              os.path.getsize(output) / 1e6,
+              load_time(output, kwargs.get("json_lines"))))
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    make_csv("bench.csv", rows)
+    print("CSV: {} rows, {:.1f} MB".format(
+        rows, os.path.getsize("bench.csv") / 1e6))
+    try:
+        run("default", rows)
+        run("compact=True", rows, compact=True)
+        run("stream=True", rows, stream=True)
+        run("stream, compact", rows, stream=True, compact=True)
+        run("json_lines=True", rows, json_lines=True)
+        workers = max(os.cpu_count() or 1, 2)
+        run("workers={}".format(workers), rows, workers=workers,
+            chunk_size=1 << 22)
+        run("infer_types=True", rows, infer_types=True)
+        run("infer_types, columnar", rows, infer_types=True, columnar=True)
+        run("infer_types, compact", rows, infer_types=True, compact=True)
+    finally:
+        for name in ("bench.csv", "data.json", "data.jsonl"):
+            if os.path.exists(name):
+                os.remove(name)
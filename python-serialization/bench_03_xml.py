@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Benchmark for task_03_xml: peak RSS of ET.parse against iterparse,
+each measured in a fresh interpreter.
+Usage: ./bench_03_xml.py [number_of_elements]
+"""
+
+import os
+import subprocess
+import sys
+
+READERS = {
+    "baseline": "pass",
+    "deserialize_from_xml":
+        "deserialize_from_xml(path)",
+    "deserialize_from_xml(stream)":
+        "deserialize_from_xml(path, stream=True)",
+    "iter_deserialize_from_xml":
+        "sum(1 for _ in iter_deserialize_from_xml(path))",
+}
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    path = "bench.xml"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("<?xml version='1.0' encoding='utf-8'?>\n<data>")
+        for i in range(count):
+            # Few distinct tags: the dictionary stays small
+            f.write("<item_{}>value {}</item_{}>".format(i % 100, i, i % 100))
+        f.write("</data>")
+    print("XML: {} elements, {:.1f} MB".format(
+        count, os.path.getsize(path) / 1e6))
+    here = os.path.dirname(os.path.abspath(__file__))
+    try:
+        for name, code in READERS.items():
+            script = ("import resource, sys\nsys.path.insert(0, {!r})\n"
+                      "from task_03_xml import *\npath = {!r}\n{}\n"
+                      "print(resource.getrusage(resource.RUSAGE_SELF)"
+                      ".ru_maxrss)").format(here, path, code)
+            out = subprocess.check_output([sys.executable, "-c", script])
+            print("{:30} peak RSS {:8.1f} MB".format(name, int(out) / 1024))
+    finally:
+        os.remove(path)
@@ -3,28 +3,517 @@
 CSV to JSON conversion module
 """
 
+import concurrent.futures
+import contextlib
 import csv
+import io
+import itertools
 import json
+import math
+import os
+import re
+import shutil
+import tempfile
 
 
-def convert_csv_to_json(csv_filename):
+_quote = json.encoder.encode_basestring_ascii
+_ENCODERS = {
+    str: _quote,
+    int: int.__repr__,
+    float: float.__repr__,
+    bool: lambda v: "true" if v else "false",
+    type(None): lambda v: "null",
+}
+
+# Only plain JSON numbers are coerced: "007", "1_000", "+1", "nan" stay
+# strings
+_INT = re.compile(r"-?(0|[1-9][0-9]*)\Z")
+_FLOAT = re.compile(r"-?(0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?\Z")
+_BOOLS = {"true": True, "false": False}
+
+# Scanning CSV bytes the way the default csv dialect reads them: a '"'
+# opens a quoted field only at the start of a field, elsewhere it is a
+# literal character (csv accepts 1,5" screen). Inside quotes "" is an
+# escaped quote. _SKIP stops at the end or at the opening quote of a
+# field that is still open there.
+_QUOTED = rb'"[^"]*(?:""[^"]*)*"(?!")'
+_SKIP = re.compile(rb'[^"]*(?:(?:(?<=[^,\r\n])"|(?<![^,\r\n])' + _QUOTED +
+                   rb')[^"]*)*')
+_CLOSE = re.compile(_QUOTED)
+_LINE_END = re.compile(rb'[\r\n]')
+
+# Punctuation of a JSON array of rows: (opening, separator, closing, empty)
+_PRETTY_ARRAY = ("[\n    ", ",\n    ", "\n]", "[]")
+_COMPACT_ARRAY = ("[", ",", "]", "[]")
+_COMPACT_SEPARATORS = (",", ":")
+_compact_encode = json.JSONEncoder(separators=_COMPACT_SEPARATORS).encode
+
+
+def infer_column_types(rows, fieldnames):
+    """
+    Guesses the type of each column from a sample of rows.
+    Empty and missing values are ignored; a column whose values all
+    look like integers is "int", like numbers "float", like true/false
+    (any case) "bool", and "str" otherwise.
+    Args:
+        rows (list): Sample of rows from csv.DictReader.
+        fieldnames (list): Header of the CSV file.
+
+    Returns:
+        dict: Column name -> "int", "float", "bool" or "str".
+    """
+    types = {}
+    for name in fieldnames:
+        values = [row.get(name) for row in rows]
+        values = [v for v in values if isinstance(v, str) and v != ""]
+        if not values:
+            types[name] = "str"
+        elif all(_INT.match(v) for v in values):
+            types[name] = "int"
+        elif all(_FLOAT.match(v) for v in values):
+            types[name] = "float"
+        elif all(v.lower() in _BOOLS for v in values):
+            types[name] = "bool"
+        else:
+            types[name] = "str"
+    return types
+
+
+def _to_int(value):
+    """Converts an integer string, keeps anything else"""
+    return int(value) if _INT.match(value) else value
+
+
+def _to_float(value):
+    """Converts a number string, keeps anything else"""
+    if _FLOAT.match(value):
+        number = float(value)
+        # 1e999 overflows to inf, which JSON cannot represent
+        if math.isfinite(number):
+            return number
+    return value
+
+
+def _to_bool(value):
+    """Converts true/false (any case), keeps anything else"""
+    return _BOOLS.get(value.lower(), value)
+
+
+_CONVERTERS = {"int": _to_int, "float": _to_float, "bool": _to_bool}
+
+
+def make_row_converter(types):
+    """
+    Builds a function coercing the values of a row to the column types.
+    Empty values of typed columns become None. A value that does not
+    match its column type (the sample did not show it) is kept as is.
+    Args:
+        types (dict): Column name -> type, from infer_column_types.
+
+    Returns:
+        callable: Function taking a row and returning the typed row.
+    """
+    converters = {name: _CONVERTERS[kind] for name, kind in types.items()
+                  if kind in _CONVERTERS}
+
+    def convert(row):
+        """Returns a copy of row with typed values"""
+        typed = {}
+        for key, value in row.items():
+            converter = converters.get(key)
+            if converter is not None and isinstance(value, str):
+                value = converter(value) if value != "" else None
+            typed[key] = value
+        return typed
+    return convert
+
+
+def format_row(row, compact=False):
+    """
+    Formats a CSV row as json.dump(..., indent=4) does inside an array.
+    Rows of scalars (the common case) skip the pure Python indenting
+    encoder; rows with extra fields (restkey lists) go through it.
+    Args:
+        row (dict): Row from csv.DictReader.
+        compact (bool): If True, no whitespace at all.
+
+    Returns:
+        str: The JSON text of the row, indented one level.
+    """
+    try:
+        items = [_quote(k) + (":" if compact else ": ") +
+                 _ENCODERS[type(v)](v) for k, v in row.items()]
+    except (KeyError, TypeError):
+        if compact:
+            return _compact_encode(row)
+        return json.dumps(row, indent=4).replace("\n", "\n    ")
+    if compact:
+        return "{" + ",".join(items) + "}"
+    if not items:
+        return "{}"
+    return "{\n        " + ",\n        ".join(items) + "\n    }"
+
+
+def write_json_array(rows, json_file, compact=False):
+    """
+    Writes rows as a JSON array, one row at a time.
+    The output is byte for byte what json.dump(list(rows), json_file,
+    indent=4) writes (or, if compact, with separators=(",", ":")),
+    without holding all the rows in memory.
+    Args:
+        rows (iterable): Rows (dictionaries) to write.
+        json_file: Text file opened for writing.
+        compact (bool): If True, writes no whitespace.
+    """
+    opening, separator, closing, empty = \
+        _COMPACT_ARRAY if compact else _PRETTY_ARRAY
+    first = True
+    for row in rows:
+        json_file.write(opening if first else separator)
+        first = False
+        json_file.write(format_row(row, compact))
+    json_file.write(empty if first else closing)
+
+
+def write_json_lines(rows, json_file, compact=False):
+    """
+    Writes rows as JSON Lines: one JSON object per line.
+    Args:
+        rows (iterable): Rows (dictionaries) to write.
+        json_file: Text file opened for writing.
+        compact (bool): If True, writes no whitespace inside objects.
+    """
+    encode = _compact_encode if compact else json.dumps
+    for row in rows:
+        json_file.write(encode(row))
+        json_file.write("\n")
+
+
+def find_record_boundaries(csv_filename, chunk_size, block_size=1 << 22):
+    """
+    Splits a CSV file into byte ranges that start and end on records.
+    The file is scanned once, the way csv parses it: a newline only
+    ends a record outside a quoted field, and a '"' only opens a quoted
+    field at the start of a field (a quote inside an unquoted field, as
+    in 1,5" screen, is a literal character).
+    Args:
+        csv_filename (str): Path to the CSV file.
+        chunk_size (int): Approximate size of each range in bytes.
+        block_size (int): Number of bytes read at a time while scanning.
+
+    Returns:
+        list: Offsets [start of data, ..., end of file]; the first range
+        is the header record.
+    """
+    size = os.path.getsize(csv_filename)
+    boundaries = [0]
+    target = 0  # first boundary wanted: end of the header
+    buf = b""
+    start = 0  # offset of buf in the file
+    with open(csv_filename, "rb") as f:
+        while True:
+            # Read at least as much again so a long quoted field is not
+            # rescanned once per block
+            block = f.read(max(block_size, len(buf)))
+            eof = not block
+            buf += block
+            pos = 0  # outside quotes, or on the quote opening a field
+            while True:
+                newline = _LINE_END.search(buf, max(target - start, pos))
+                if newline is not None:
+                    stop = newline.start()
+                else:
+                    # Target in a later block: skip to the last line end
+                    stop = max(buf.rfind(b"\n"), buf.rfind(b"\r"))
+                    if stop <= pos:
+                        break
+                end = _SKIP.match(buf, pos, stop).end()
+                if end < stop:
+                    # The line end is inside a quoted field: go on after it
+                    quoted = _CLOSE.match(buf, end)
+                    if quoted is None or \
+                            (quoted.end() == len(buf) and not eof):
+                        pos = end  # closes in a later block
+                        break
+                    pos = quoted.end()
+                    continue
+                pos = stop
+                if newline is None:
+                    break
+                end = stop + 1
+                if buf[stop:end] == b"\r":
+                    if end == len(buf) and not eof:
+                        break  # may be followed by "\n"
+                    if buf[end:end + 1] == b"\n":
+                        end += 1
+                pos = end
+                boundaries.append(start + end)
+                target = start + end + chunk_size
+            if eof:
+                break
+            buf = buf[pos:]
+            start += pos
+    if len(boundaries) == 1 or boundaries[-1] != size:
+        boundaries.append(size)
+    return boundaries
+
+
+def read_records(data):
+    """
+    Decodes a byte range of a CSV file as open() would read it.
+    Args:
+        data (bytes): Whole records of the CSV file.
+
+    Returns:
+        io.StringIO: Text with universal newlines, ready for csv.
+    """
+    text = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    return io.StringIO(text, newline="")
+
+
+def convert_range(csv_filename, start, end, fieldnames, part_filename,
+                  json_lines, types=None, compact=False):
+    """
+    Converts the records between two byte offsets to a JSON fragment.
+    Runs in a worker process.
+    Args:
+        csv_filename (str): Path to the CSV file.
+        start (int): Offset of the first record.
+        end (int): Offset after the last record.
+        fieldnames (list): Header of the CSV file.
+        part_filename (str): File receiving the fragment.
+        json_lines (bool): Write JSON Lines instead of array items.
+        types (dict): Column types to coerce to, None to keep strings.
+        compact (bool): If True, writes no whitespace.
+
+    Returns:
+        int: Number of rows converted.
+    """
+    with open(csv_filename, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    reader = csv.DictReader(read_records(data), fieldnames=fieldnames)
+    if types is not None:
+        reader = map(make_row_converter(types), reader)
+    count = 0
+    encode = _compact_encode if compact else json.dumps
+    separator = (_COMPACT_ARRAY if compact else _PRETTY_ARRAY)[1]
+    with open(part_filename, mode="w", encoding="utf-8") as part:
+        for row in reader:
+            if json_lines:
+                part.write(encode(row))
+                part.write("\n")
+            else:
+                part.write(separator if count else "")
+                part.write(format_row(row, compact))
+            count += 1
+    return count
+
+
+def convert_parallel(csv_filename, json_file, json_lines, workers,
+                     chunk_size, sample_size=None, compact=False):
+    """
+    Converts a CSV file with a pool of processes.
+    The file is cut into ranges of whole records (quoted newlines
+    included), each range becomes a JSON fragment in a worker, and the
+    fragments are joined in file order. The output is the same as the
+    single process conversion.
+    Args:
+        csv_filename (str): Path to the CSV file.
+        json_file: Text file opened for writing, in the directory that
+            receives the temporary fragments.
+        json_lines (bool): Write JSON Lines instead of a JSON array.
+        workers (int): Number of processes.
+        chunk_size (int): Approximate size of each range in bytes.
+        sample_size (int): If set, column types are inferred from that
+            many first rows and applied by every worker.
+        compact (bool): If True, writes no whitespace.
+    """
+    boundaries = find_record_boundaries(csv_filename, chunk_size)
+    with open(csv_filename, "rb") as f:
+        header = f.read(boundaries[1] - boundaries[0])
+    fieldnames = next(csv.reader(read_records(header)), None)
+    types = None
+    if sample_size is not None:
+        with open(csv_filename, mode="r", encoding="utf-8") as csv_file:
+            sample = list(itertools.islice(csv.DictReader(csv_file),
+                                           sample_size))
+        types = infer_column_types(sample, fieldnames or [])
+    ranges = list(zip(boundaries[1:-1], boundaries[2:]))
+
+    directory = os.path.dirname(os.path.abspath(json_file.name))
+    tmp_dir = tempfile.mkdtemp(prefix=".csv_parts_", dir=directory)
+    try:
+        parts = [os.path.join(tmp_dir, "{}.part".format(i))
+                 for i in range(len(ranges))]
+        with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+            futures = [pool.submit(convert_range, csv_filename, start, end,
+                                   fieldnames, part, json_lines, types,
+                                   compact)
+                       for (start, end), part in zip(ranges, parts)]
+            counts = [future.result() for future in futures]
+
+        opening, separator, closing, empty = \
+            _COMPACT_ARRAY if compact else _PRETTY_ARRAY
+        first = True
+        for part, count in zip(parts, counts):
+            if not count:
+                continue
+            if not json_lines:
+                json_file.write(opening if first else separator)
+            first = False
+            with open(part, mode="r", encoding="utf-8") as fragment:
+                shutil.copyfileobj(fragment, json_file, 1 << 20)
+        if not json_lines:
+            json_file.write(empty if first else closing)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def write_json_columns(rows, fieldnames, json_file, compact=False):
+    """
+    Writes rows in a columnar layout: {"column": [values...], ...},
+    without indentation. Columns are gathered in memory (as lists of
+    values, much smaller than one dictionary per row).
+    Args:
+        rows (iterable): Rows (dictionaries) to write.
+        fieldnames (list): Header of the CSV file.
+        json_file: Text file opened for writing.
+        compact (bool): If True, writes no whitespace.
+    Raises:
+        ValueError: If a row has more fields than the header.
+    """
+    columns = {name: [] for name in fieldnames}
+    for line, row in enumerate(rows, 1):
+        if None in row:
+            raise ValueError("row {} has more fields than the header"
+                             .format(line))
+        for name in fieldnames:
+            columns[name].append(row[name])
+    json.dump(columns, json_file,
+              separators=_COMPACT_SEPARATORS if compact else None)
+
+
+def _create_temp(directory):
+    """
+    Creates a new empty file with a random name in directory.
+    The file is created with mode 0o666 minus the umask, as open() would
+    create it, without touching the umask of the process.
+    Args:
+        directory (str): Directory of the file.
+
+    Returns:
+        str: Path of the file.
+    """
+    while True:
+        name = os.path.join(directory,
+                            ".{}.tmp".format(os.urandom(8).hex()))
+        try:
+            fd = os.open(name, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+        except FileExistsError:
+            continue
+        os.close(fd)
+        return name
+
+
+@contextlib.contextmanager
+def open_atomic(filename):
+    """
+    Opens a temporary file next to filename for writing; it replaces
+    filename only once the block succeeds. Concurrent conversions to the
+    same file therefore never interleave, and readers never see a
+    partial file. An existing filename keeps its permissions.
+    Args:
+        filename (str): Path of the file to write.
+    """
+    tmp_name = _create_temp(os.path.dirname(os.path.abspath(filename)))
+    try:
+        with open(tmp_name, mode="w", encoding="utf-8") as f:
+            yield f
+        try:
+            os.chmod(tmp_name, os.stat(filename).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_name, filename)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        raise
+
+
+def convert_csv_to_json(csv_filename, stream=False, json_lines=False,
+                        workers=None, chunk_size=1 << 26, infer_types=False,
+                        columnar=False, sample_size=1000, json_filename=None,
+                        compact=False):
     """
     Converts a CSV file to a JSON file named 'data.json'.
+    The JSON file is written under a temporary name and renamed at the
+    end, so concurrent conversions do not overwrite each other's output.
     Args:
         csv_filename (str): Path to the CSV file.
+        stream (bool): If True, rows are written as they are read, so
+            memory does not grow with the size of the CSV file.
+        json_lines (bool): If True, writes 'data.jsonl' in the JSON
+            Lines format instead (always streamed).
+        workers (int): If greater than 1, the file is split into ranges
+            of about chunk_size bytes converted by that many processes.
+        chunk_size (int): Size of the ranges of the parallel mode.
+        infer_types (bool): If True, columns whose first sample_size
+            values are all integers, numbers or true/false are written
+            as JSON numbers / booleans (empty values as null).
+        columnar (bool): If True, writes {"column": [values...]} without
+            indentation instead of a list of objects (single process).
+        sample_size (int): Number of rows used to infer column types.
+        json_filename (str): Path to the output file, 'data.json' (or
+            'data.jsonl' with json_lines) by default.
+        compact (bool): If True, writes no indentation nor spaces, which
+            is smaller and faster to encode than indent=4.
 
     Returns:
         bool: True if conversion successful, False otherwise.
     """
+    if json_filename is None:
+        json_filename = "data.jsonl" if json_lines else "data.json"
     try:
+        if workers is not None and workers > 1 and not columnar:
+            with open_atomic(json_filename) as json_file:
+                convert_parallel(csv_filename, json_file, json_lines,
+                                 workers, chunk_size,
+                                 sample_size if infer_types else None,
+                                 compact)
+            return True
+
+        if stream or json_lines or infer_types or columnar:
+            with open(csv_filename, mode="r", encoding="utf-8") as csv_file, \
+                    open_atomic(json_filename) as json_file:
+                reader = csv.DictReader(csv_file)
+                rows = reader
+                if infer_types:
+                    # Infer from the first rows, then put them back
+                    sample = list(itertools.islice(reader, sample_size))
+                    types = infer_column_types(sample, reader.fieldnames or [])
+                    rows = map(make_row_converter(types),
+                               itertools.chain(sample, reader))
+                if columnar:
+                    write_json_columns(rows, reader.fieldnames or [],
+                                       json_file, compact)
+                elif json_lines:
+                    write_json_lines(rows, json_file, compact)
+                else:
+                    write_json_array(rows, json_file, compact)
+            return True
+
         # Read CSV file
         with open(csv_filename, mode="r", encoding="utf-8") as csv_file:
             reader = csv.DictReader(csv_file)
             data = [row for row in reader]  # List of dictionaries
 
         # Write JSON file
-        with open("data.json", mode="w", encoding="utf-8") as json_file:
-            json.dump(data, json_file, indent=4)
+        with open_atomic(json_filename) as json_file:
+            if compact:
+                json.dump(data, json_file, separators=_COMPACT_SEPARATORS)
+            else:
+                json.dump(data, json_file, indent=4)
 
         return True
 
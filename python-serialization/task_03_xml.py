@@ -26,15 +26,47 @@ def serialize_to_xml(dictionary, filename):
     tree.write(filename, encoding="utf-8", xml_declaration=True)
 
 
-def deserialize_from_xml(filename):
+def iter_deserialize_from_xml(filename):
+    """
+    Iterate over the children of the root of an XML file.
+    Elements are parsed incrementally with iterparse and cleared once
+    read, so memory stays flat however large the file is.
+    Args:
+        filename (str): The XML file to read.
+    Yields:
+        tuple: (tag, text) of each child of the root, in file order.
+    Raises:
+        ET.ParseError: If the file is not well-formed XML.
+    """
+    depth = 0
+    root = None
+    for event, elem in ET.iterparse(filename, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 1:
+            yield elem.tag, elem.text
+            # Drop the child (and its subtree) from the root
+            root.clear()
+
+
+def deserialize_from_xml(filename, stream=False):
     """
     Deserialize an XML file to a Python dictionary.
     Args:
         filename (str): The XML file to read.
+        stream (bool): If True, the file is read with
+            iter_deserialize_from_xml instead of building the whole tree.
     Returns:
         dict: Dictionary representation of the XML data.
     """
     try:
+        if stream:
+            return dict(iter_deserialize_from_xml(filename))
+
         tree = ET.parse(filename)       # parse XML file
         root = tree.getroot()           # get root element
         result = {}
@@ -48,4 +80,3 @@ def deserialize_from_xml(filename):
     except (ET.ParseError, FileNotFoundError):
         # Return empty dict or None if file is invalid or missing
         return {}
-